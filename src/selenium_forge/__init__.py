@@ -27,6 +27,8 @@ Quick Start:
     driver = forge.create_driver()
 """
 
+from typing import Any, List
+
 __version__ = "0.1.0"
 __author__ = "Abdessamad Haddouche"
 __email__ = "abdessamad.hadd@gmail.com"
@@ -39,43 +41,58 @@ __url__ = "https://github.com/abdessamad-haddouche/selenium-forge"
 __license__ = "MIT"
 
 
-# Main API
-from selenium_forge.forge import SeleniumForge
-
-# Configuration
-from selenium_forge.config import ConfigLoader, DefaultConfigs
+# Public names are imported lazily (PEP 562) so that lightweight entry points
+# (e.g. `selenium-forge system-info`) don't pay the full transitive import cost
+# of selenium, yaml, and requests on every invocation.
+_LAZY_IMPORTS = {
+    # Main API
+    "SeleniumForge": "selenium_forge.forge",
+    # Configuration
+    "ConfigLoader": "selenium_forge.config",
+    "DefaultConfigs": "selenium_forge.config",
+    # Core types
+    "BrowserOptions": "selenium_forge.core.types",
+    "DriverConfig": "selenium_forge.core.types",
+    "ProxyConfig": "selenium_forge.core.types",
+    "StealthConfig": "selenium_forge.core.types",
+    "SystemInfo": "selenium_forge.core.types",
+    # Session management
+    "ForgeContext": "selenium_forge.session",
+    "SessionManager": "selenium_forge.session",
+    # Driver management
+    "DriverFactory": "selenium_forge.drivers",
+    "DriverManager": "selenium_forge.drivers",
+    # Stealth and proxy
+    "ProxyManager": "selenium_forge.proxy",
+    "ProxyRotator": "selenium_forge.proxy",
+    "StealthEngine": "selenium_forge.stealth",
+    # Exceptions
+    "CriticalError": "selenium_forge.exceptions",
+    "DeprecationError": "selenium_forge.exceptions",
+    "InternalError": "selenium_forge.exceptions",
+    "RetryableError": "selenium_forge.exceptions",
+    "SeleniumForgeError": "selenium_forge.exceptions",
+    "UserError": "selenium_forge.exceptions",
+    # Platform utilities
+    "PlatformDetector": "selenium_forge.core.platform",
+}
 
-# Core types
-from selenium_forge.core.types import (
-    BrowserOptions,
-    DriverConfig,
-    ProxyConfig,
-    StealthConfig,
-    SystemInfo,
-)
 
-# Session management
-from selenium_forge.session import ForgeContext, SessionManager
+def __getattr__(name: str) -> Any:
+    """Resolve public names on first access (PEP 562 lazy imports)."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Driver management
-from selenium_forge.drivers import DriverFactory, DriverManager
+    import importlib
 
-# Stealth and proxy
-from selenium_forge.proxy import ProxyManager, ProxyRotator
-from selenium_forge.stealth import StealthEngine
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Cache so subsequent lookups skip __getattr__
+    return value
 
-# Exceptions
-from selenium_forge.exceptions import (
-    CriticalError,
-    DeprecationError,
-    InternalError,
-    RetryableError,
-    SeleniumForgeError,
-    UserError,
-)
 
-# Platform utilities
-from selenium_forge.core.platform import PlatformDetector
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 __all__ = [
     # Main API
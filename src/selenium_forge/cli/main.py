@@ -4,15 +4,45 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
 
+if TYPE_CHECKING:
+    from selenium_forge.drivers.manager import DriverManager
+
 from selenium_forge import SeleniumForge, __version__
 from selenium_forge.config.loader import ConfigLoader
 from selenium_forge.core.platform import PlatformDetector
 
 
+# Shared Choice instances: the same choice sets appear across several
+# subcommands, so build each once at import instead of per-decorator.
+_BROWSERS = click.Choice(("chrome", "firefox", "edge", "safari"), case_sensitive=False)
+_BROWSERS_ALL = click.Choice(
+    ("chrome", "firefox", "edge", "safari", "all"), case_sensitive=False
+)
+_TEMPLATES = click.Choice(
+    ("basic", "advanced", "stealth", "headless", "performance", "testing")
+)
+
+# Bundled config templates live alongside the package; resolve once at import
+_TEMPLATE_DIR = Path(__file__).resolve().parent.parent / "config" / "templates"
+
+# Shared DriverManager, created on first use so commands that don't touch
+# drivers skip the cache-directory setup entirely
+_manager: Optional[DriverManager] = None
+
+
+def _get_manager() -> DriverManager:
+    global _manager
+    if _manager is None:
+        from selenium_forge.drivers.manager import DriverManager
+
+        _manager = DriverManager()
+    return _manager
+
+
 @click.group()
 @click.version_option(version=__version__, prog_name="selenium-forge")
 def main() -> None:
@@ -24,7 +54,7 @@ def main() -> None:
 @click.option(
     "--browser",
     "-b",
-    type=click.Choice(["chrome", "firefox", "edge", "safari"], case_sensitive=False),
+    type=_BROWSERS,
     default="chrome",
     help="Browser type",
 )
@@ -74,14 +104,26 @@ def launch(
             click.echo(f"Navigating to {url}...")
             driver.get(url)
 
-        click.echo("Browser launched successfully!")
-        click.echo("Press Ctrl+C to quit...")
+        click.echo("Browser launched successfully!\nPress Ctrl+C to quit...")
+
+        # Keep browser open until interrupted. An Event parked in a kernel
+        # wait is lighter than input(), which holds stdin open and wakes the
+        # interpreter on every keystroke.
+        import signal
+        import threading
 
-        # Keep browser open until interrupted
+        stop = threading.Event()
         try:
-            input()
-        except KeyboardInterrupt:
-            pass
+            previous_handler = signal.signal(signal.SIGINT, lambda *_: stop.set())
+        except ValueError:
+            # Not on the main thread; fall back to the interrupt exception
+            try:
+                stop.wait()
+            except KeyboardInterrupt:
+                pass
+        else:
+            stop.wait()
+            signal.signal(signal.SIGINT, previous_handler)
 
         driver.quit()
         click.echo("Browser closed.")
@@ -95,7 +137,7 @@ def launch(
 @click.option(
     "--browser",
     "-b",
-    type=click.Choice(["chrome", "firefox", "edge", "safari", "all"], case_sensitive=False),
+    type=_BROWSERS_ALL,
     default="all",
     help="Browser to clear cache for",
 )
@@ -107,10 +149,9 @@ def clear_cache(browser: str) -> None:
         selenium-forge clear-cache --browser chrome
     """
     try:
-        from selenium_forge.drivers.manager import DriverManager
         from selenium_forge.core.constants import BrowserType
 
-        manager = DriverManager()
+        manager = _get_manager()
 
         if browser == "all":
             count = manager.clear_cache()
@@ -134,15 +175,22 @@ def system_info() -> None:
     try:
         info = PlatformDetector.get_system_info()
 
-        click.echo("\nSystem Information:")
-        click.echo(f"  OS: {info.os}")
-        click.echo(f"  OS Version: {info.os_version}")
-        click.echo(f"  Architecture: {info.architecture}")
-        click.echo(f"  Python: {info.python_version}")
-        click.echo(f"  Selenium: {info.selenium_version}")
-        click.echo(f"  WSL: {info.is_wsl}")
-        click.echo(f"  Display: {info.has_display}")
-        click.echo()
+        # One batched echo -> one write() instead of nine
+        click.echo(
+            "\n".join(
+                (
+                    "\nSystem Information:",
+                    f"  OS: {info.os}",
+                    f"  OS Version: {info.os_version}",
+                    f"  Architecture: {info.architecture}",
+                    f"  Python: {info.python_version}",
+                    f"  Selenium: {info.selenium_version}",
+                    f"  WSL: {info.is_wsl}",
+                    f"  Display: {info.has_display}",
+                    "",
+                )
+            )
+        )
 
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
@@ -153,14 +201,14 @@ def system_info() -> None:
 @click.option(
     "--browser",
     "-b",
-    type=click.Choice(["chrome", "firefox", "edge", "safari"], case_sensitive=False),
+    type=_BROWSERS,
     default="chrome",
     help="Browser type",
 )
 @click.option(
     "--template",
     "-t",
-    type=click.Choice(["basic", "advanced", "stealth", "headless", "performance", "testing"]),
+    type=_TEMPLATES,
     default="basic",
     help="Configuration template",
 )
@@ -194,11 +242,12 @@ def init_config(browser: str, template: str, output: str, force: bool) -> None:
         from selenium_forge.config import defaults
         import shutil
 
-        template_dir = Path(__file__).parent.parent / "config" / "templates"
-        template_file = template_dir / f"{template}.yaml"
+        template_file = _TEMPLATE_DIR / f"{template}.yaml"
 
         if template_file.exists():
-            shutil.copy(template_file, output_path)
+            # copyfile skips the metadata copy and uses the zero-copy
+            # fast path (sendfile) on Linux
+            shutil.copyfile(template_file, output_path)
         else:
             # Create from defaults
             if template == "basic":
@@ -254,7 +303,7 @@ def validate(config_file: str) -> None:
 @click.option(
     "--browser",
     "-b",
-    type=click.Choice(["chrome", "firefox", "edge", "safari"], case_sensitive=False),
+    type=_BROWSERS,
     default="chrome",
     help="Browser type",
 )
@@ -265,21 +314,26 @@ def check_driver(browser: str) -> None:
         selenium-forge check-driver --browser chrome
     """
     try:
-        from selenium_forge.drivers.manager import DriverManager
         from selenium_forge.core.constants import BrowserType
 
         browser_type = BrowserType(browser)
-        manager = DriverManager()
+        manager = _get_manager()
 
         click.echo(f"Checking {browser} driver...")
 
         if manager.is_driver_available(browser_type):
             info = manager.get_driver_info(browser_type)
             if info:
-                click.echo(f"Driver found:")
-                click.echo(f"  Path: {info.driver_path}")
-                click.echo(f"  Version: {info.driver_version}")
-                click.echo(f"  Last updated: {info.last_updated}")
+                click.echo(
+                    "\n".join(
+                        (
+                            "Driver found:",
+                            f"  Path: {info.driver_path}",
+                            f"  Version: {info.driver_version}",
+                            f"  Last updated: {info.last_updated}",
+                        )
+                    )
+                )
             else:
                 click.echo(f"Driver can be downloaded automatically")
         else:
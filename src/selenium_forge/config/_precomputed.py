@@ -0,0 +1,559 @@
+"""Precomputed merged preset/scenario configurations.
+
+Generated by tools/build_defaults_cache.py -- do not edit by hand.
+``SOURCE_HASH`` is the SHA-256 of config/defaults.py at generation time;
+a mismatch at runtime means this cache is stale and is ignored.
+"""
+
+SOURCE_HASH = '771ac3af302e5c7555d409fcb5357abf78ac114def6946995c8d79618dd36608'
+
+PRESETS = {   ('chrome', 'headless'): {   'browser': 'chrome',
+                                'browser_options': {   'arguments': (   '--window-size=1920,1080',
+                                                                        '--disable-gpu'),
+                                                       'auto_download': True,
+                                                       'disable_css': False,
+                                                       'disable_images': False,
+                                                       'disable_javascript': False,
+                                                       'experimental_options': {   'excludeSwitches': (   'enable-automation',
+                                                                                                          'enable-logging'),
+                                                                                   'useAutomationExtension': False},
+                                                       'headless': True,
+                                                       'preferences': {   'credentials_enable_service': False,
+                                                                          'profile.default_content_setting_values.notifications': 2,
+                                                                          'profile.password_manager_enabled': False},
+                                                       'start_maximized': False,
+                                                       'window_size': None},
+                                'driver_version': 'latest',
+                                'enable_logging': True,
+                                'implicit_wait': 10,
+                                'log_level': 'INFO',
+                                'page_load_timeout': 60,
+                                'script_timeout': 30},
+    ('chrome', 'mobile'): {   'browser': 'chrome',
+                              'browser_options': {   'arguments': (   '--disable-blink-features=AutomationControlled',
+                                                                      '--disable-dev-shm-usage',
+                                                                      '--no-sandbox'),
+                                                     'auto_download': True,
+                                                     'disable_css': False,
+                                                     'disable_images': False,
+                                                     'disable_javascript': False,
+                                                     'experimental_options': {   'excludeSwitches': (   'enable-automation',
+                                                                                                        'enable-logging'),
+                                                                                 'mobileEmulation': {   'deviceName': 'iPhone '
+                                                                                                                      '12 '
+                                                                                                                      'Pro'},
+                                                                                 'useAutomationExtension': False},
+                                                     'headless': False,
+                                                     'preferences': {   'credentials_enable_service': False,
+                                                                        'profile.default_content_setting_values.notifications': 2,
+                                                                        'profile.password_manager_enabled': False},
+                                                     'start_maximized': False,
+                                                     'window_size': None},
+                              'driver_version': 'latest',
+                              'enable_logging': True,
+                              'implicit_wait': 10,
+                              'log_level': 'INFO',
+                              'page_load_timeout': 60,
+                              'script_timeout': 30},
+    ('chrome', 'performance'): {   'browser': 'chrome',
+                                   'browser_options': {   'arguments': (   '--disable-extensions',
+                                                                           '--disable-plugins',
+                                                                           '--disable-infobars',
+                                                                           '--mute-audio'),
+                                                          'auto_download': True,
+                                                          'disable_css': False,
+                                                          'disable_images': True,
+                                                          'disable_javascript': False,
+                                                          'experimental_options': {   'excludeSwitches': (   'enable-automation',
+                                                                                                             'enable-logging'),
+                                                                                      'useAutomationExtension': False},
+                                                          'headless': False,
+                                                          'preferences': {   'credentials_enable_service': False,
+                                                                             'profile.default_content_setting_values.notifications': 2,
+                                                                             'profile.password_manager_enabled': False},
+                                                          'start_maximized': False,
+                                                          'window_size': None},
+                                   'driver_version': 'latest',
+                                   'enable_logging': True,
+                                   'implicit_wait': 10,
+                                   'log_level': 'INFO',
+                                   'page_load_timeout': 60,
+                                   'script_timeout': 30},
+    ('chrome', 'stealth'): {   'browser': 'chrome',
+                               'browser_options': {   'arguments': (   '--disable-blink-features=AutomationControlled',
+                                                                       '--disable-dev-shm-usage',
+                                                                       '--no-sandbox'),
+                                                      'auto_download': True,
+                                                      'disable_css': False,
+                                                      'disable_images': False,
+                                                      'disable_javascript': False,
+                                                      'experimental_options': {   'excludeSwitches': (   'enable-automation',
+                                                                                                         'enable-logging'),
+                                                                                  'useAutomationExtension': False},
+                                                      'headless': False,
+                                                      'preferences': {   'credentials_enable_service': False,
+                                                                         'profile.default_content_setting_values.notifications': 2,
+                                                                         'profile.password_manager_enabled': False},
+                                                      'start_maximized': False,
+                                                      'window_size': None},
+                               'driver_version': 'latest',
+                               'enable_logging': True,
+                               'implicit_wait': 10,
+                               'log_level': 'INFO',
+                               'page_load_timeout': 60,
+                               'script_timeout': 30,
+                               'stealth': {   'enabled': True,
+                                              'hide_webdriver': True,
+                                              'mask_fingerprint': True,
+                                              'randomize_audio': True,
+                                              'randomize_canvas': True,
+                                              'randomize_user_agent': True,
+                                              'randomize_webgl': True,
+                                              'remove_automation_flags': True}},
+    ('chrome', 'testing'): {   'browser': 'chrome',
+                               'browser_options': {   'arguments': (   '--no-sandbox',
+                                                                       '--disable-dev-shm-usage',
+                                                                       '--disable-gpu'),
+                                                      'auto_download': True,
+                                                      'disable_css': False,
+                                                      'disable_images': False,
+                                                      'disable_javascript': False,
+                                                      'experimental_options': {   'excludeSwitches': (   'enable-automation',
+                                                                                                         'enable-logging'),
+                                                                                  'useAutomationExtension': False},
+                                                      'headless': True,
+                                                      'preferences': {   'credentials_enable_service': False,
+                                                                         'profile.default_content_setting_values.notifications': 2,
+                                                                         'profile.password_manager_enabled': False},
+                                                      'start_maximized': False,
+                                                      'window_size': None},
+                               'driver_version': 'latest',
+                               'enable_logging': True,
+                               'implicit_wait': 5.0,
+                               'log_level': 'INFO',
+                               'page_load_timeout': 30.0,
+                               'script_timeout': 30},
+    ('edge', 'headless'): {   'browser': 'edge',
+                              'browser_options': {   'arguments': (   '--window-size=1920,1080',
+                                                                      '--disable-gpu'),
+                                                     'auto_download': True,
+                                                     'disable_css': False,
+                                                     'disable_images': False,
+                                                     'disable_javascript': False,
+                                                     'experimental_options': {   'excludeSwitches': (   'enable-automation',),
+                                                                                 'useAutomationExtension': False},
+                                                     'headless': True,
+                                                     'preferences': {   'profile.default_content_setting_values.notifications': 2},
+                                                     'start_maximized': False,
+                                                     'window_size': None},
+                              'driver_version': 'latest',
+                              'enable_logging': True,
+                              'implicit_wait': 10,
+                              'log_level': 'INFO',
+                              'page_load_timeout': 60,
+                              'script_timeout': 30},
+    ('edge', 'mobile'): {   'browser': 'edge',
+                            'browser_options': {   'arguments': (   '--disable-blink-features=AutomationControlled',
+                                                                    '--disable-dev-shm-usage'),
+                                                   'auto_download': True,
+                                                   'disable_css': False,
+                                                   'disable_images': False,
+                                                   'disable_javascript': False,
+                                                   'experimental_options': {   'excludeSwitches': (   'enable-automation',),
+                                                                               'mobileEmulation': {   'deviceName': 'iPhone '
+                                                                                                                    '12 '
+                                                                                                                    'Pro'},
+                                                                               'useAutomationExtension': False},
+                                                   'headless': False,
+                                                   'preferences': {   'profile.default_content_setting_values.notifications': 2},
+                                                   'start_maximized': False,
+                                                   'window_size': None},
+                            'driver_version': 'latest',
+                            'enable_logging': True,
+                            'implicit_wait': 10,
+                            'log_level': 'INFO',
+                            'page_load_timeout': 60,
+                            'script_timeout': 30},
+    ('edge', 'performance'): {   'browser': 'edge',
+                                 'browser_options': {   'arguments': (   '--disable-extensions',
+                                                                         '--disable-plugins',
+                                                                         '--disable-infobars',
+                                                                         '--mute-audio'),
+                                                        'auto_download': True,
+                                                        'disable_css': False,
+                                                        'disable_images': True,
+                                                        'disable_javascript': False,
+                                                        'experimental_options': {   'excludeSwitches': (   'enable-automation',),
+                                                                                    'useAutomationExtension': False},
+                                                        'headless': False,
+                                                        'preferences': {   'profile.default_content_setting_values.notifications': 2},
+                                                        'start_maximized': False,
+                                                        'window_size': None},
+                                 'driver_version': 'latest',
+                                 'enable_logging': True,
+                                 'implicit_wait': 10,
+                                 'log_level': 'INFO',
+                                 'page_load_timeout': 60,
+                                 'script_timeout': 30},
+    ('edge', 'stealth'): {   'browser': 'edge',
+                             'browser_options': {   'arguments': (   '--disable-blink-features=AutomationControlled',
+                                                                     '--disable-dev-shm-usage'),
+                                                    'auto_download': True,
+                                                    'disable_css': False,
+                                                    'disable_images': False,
+                                                    'disable_javascript': False,
+                                                    'experimental_options': {   'excludeSwitches': (   'enable-automation',),
+                                                                                'useAutomationExtension': False},
+                                                    'headless': False,
+                                                    'preferences': {   'profile.default_content_setting_values.notifications': 2},
+                                                    'start_maximized': False,
+                                                    'window_size': None},
+                             'driver_version': 'latest',
+                             'enable_logging': True,
+                             'implicit_wait': 10,
+                             'log_level': 'INFO',
+                             'page_load_timeout': 60,
+                             'script_timeout': 30,
+                             'stealth': {   'enabled': True,
+                                            'hide_webdriver': True,
+                                            'mask_fingerprint': True,
+                                            'randomize_audio': True,
+                                            'randomize_canvas': True,
+                                            'randomize_user_agent': True,
+                                            'randomize_webgl': True,
+                                            'remove_automation_flags': True}},
+    ('edge', 'testing'): {   'browser': 'edge',
+                             'browser_options': {   'arguments': (   '--no-sandbox',
+                                                                     '--disable-dev-shm-usage',
+                                                                     '--disable-gpu'),
+                                                    'auto_download': True,
+                                                    'disable_css': False,
+                                                    'disable_images': False,
+                                                    'disable_javascript': False,
+                                                    'experimental_options': {   'excludeSwitches': (   'enable-automation',),
+                                                                                'useAutomationExtension': False},
+                                                    'headless': True,
+                                                    'preferences': {   'profile.default_content_setting_values.notifications': 2},
+                                                    'start_maximized': False,
+                                                    'window_size': None},
+                             'driver_version': 'latest',
+                             'enable_logging': True,
+                             'implicit_wait': 5.0,
+                             'log_level': 'INFO',
+                             'page_load_timeout': 30.0,
+                             'script_timeout': 30},
+    ('firefox', 'headless'): {   'browser': 'firefox',
+                                 'browser_options': {   'arguments': (   '--window-size=1920,1080',
+                                                                         '--disable-gpu'),
+                                                        'auto_download': True,
+                                                        'disable_css': False,
+                                                        'disable_images': False,
+                                                        'disable_javascript': False,
+                                                        'headless': True,
+                                                        'preferences': {   'dom.webdriver.enabled': False,
+                                                                           'dom.webnotifications.enabled': False,
+                                                                           'marionette.enabled': True,
+                                                                           'useAutomationExtension': False},
+                                                        'start_maximized': False,
+                                                        'window_size': None},
+                                 'driver_version': 'latest',
+                                 'enable_logging': True,
+                                 'implicit_wait': 10,
+                                 'log_level': 'INFO',
+                                 'page_load_timeout': 60,
+                                 'script_timeout': 30},
+    ('firefox', 'mobile'): {   'browser': 'firefox',
+                               'browser_options': {   'arguments': (),
+                                                      'auto_download': True,
+                                                      'disable_css': False,
+                                                      'disable_images': False,
+                                                      'disable_javascript': False,
+                                                      'experimental_options': {   'mobileEmulation': {   'deviceName': 'iPhone '
+                                                                                                                       '12 '
+                                                                                                                       'Pro'}},
+                                                      'headless': False,
+                                                      'preferences': {   'dom.webdriver.enabled': False,
+                                                                         'dom.webnotifications.enabled': False,
+                                                                         'marionette.enabled': True,
+                                                                         'useAutomationExtension': False},
+                                                      'start_maximized': False,
+                                                      'window_size': None},
+                               'driver_version': 'latest',
+                               'enable_logging': True,
+                               'implicit_wait': 10,
+                               'log_level': 'INFO',
+                               'page_load_timeout': 60,
+                               'script_timeout': 30},
+    ('firefox', 'performance'): {   'browser': 'firefox',
+                                    'browser_options': {   'arguments': (   '--disable-extensions',
+                                                                            '--disable-plugins',
+                                                                            '--disable-infobars',
+                                                                            '--mute-audio'),
+                                                           'auto_download': True,
+                                                           'disable_css': False,
+                                                           'disable_images': True,
+                                                           'disable_javascript': False,
+                                                           'headless': False,
+                                                           'preferences': {   'dom.webdriver.enabled': False,
+                                                                              'dom.webnotifications.enabled': False,
+                                                                              'marionette.enabled': True,
+                                                                              'useAutomationExtension': False},
+                                                           'start_maximized': False,
+                                                           'window_size': None},
+                                    'driver_version': 'latest',
+                                    'enable_logging': True,
+                                    'implicit_wait': 10,
+                                    'log_level': 'INFO',
+                                    'page_load_timeout': 60,
+                                    'script_timeout': 30},
+    ('firefox', 'stealth'): {   'browser': 'firefox',
+                                'browser_options': {   'arguments': (),
+                                                       'auto_download': True,
+                                                       'disable_css': False,
+                                                       'disable_images': False,
+                                                       'disable_javascript': False,
+                                                       'headless': False,
+                                                       'preferences': {   'dom.webdriver.enabled': False,
+                                                                          'dom.webnotifications.enabled': False,
+                                                                          'marionette.enabled': True,
+                                                                          'useAutomationExtension': False},
+                                                       'start_maximized': False,
+                                                       'window_size': None},
+                                'driver_version': 'latest',
+                                'enable_logging': True,
+                                'implicit_wait': 10,
+                                'log_level': 'INFO',
+                                'page_load_timeout': 60,
+                                'script_timeout': 30,
+                                'stealth': {   'enabled': True,
+                                               'hide_webdriver': True,
+                                               'mask_fingerprint': True,
+                                               'randomize_audio': True,
+                                               'randomize_canvas': True,
+                                               'randomize_user_agent': True,
+                                               'randomize_webgl': True,
+                                               'remove_automation_flags': True}},
+    ('firefox', 'testing'): {   'browser': 'firefox',
+                                'browser_options': {   'arguments': (   '--no-sandbox',
+                                                                        '--disable-dev-shm-usage',
+                                                                        '--disable-gpu'),
+                                                       'auto_download': True,
+                                                       'disable_css': False,
+                                                       'disable_images': False,
+                                                       'disable_javascript': False,
+                                                       'headless': True,
+                                                       'preferences': {   'dom.webdriver.enabled': False,
+                                                                          'dom.webnotifications.enabled': False,
+                                                                          'marionette.enabled': True,
+                                                                          'useAutomationExtension': False},
+                                                       'start_maximized': False,
+                                                       'window_size': None},
+                                'driver_version': 'latest',
+                                'enable_logging': True,
+                                'implicit_wait': 5.0,
+                                'log_level': 'INFO',
+                                'page_load_timeout': 30.0,
+                                'script_timeout': 30},
+    ('safari', 'headless'): {   'browser': 'safari',
+                                'browser_options': {   'arguments': (   '--window-size=1920,1080',
+                                                                        '--disable-gpu'),
+                                                       'auto_download': True,
+                                                       'disable_css': False,
+                                                       'disable_images': False,
+                                                       'disable_javascript': False,
+                                                       'headless': True,
+                                                       'start_maximized': False,
+                                                       'window_size': None},
+                                'driver_version': 'system',
+                                'enable_logging': True,
+                                'implicit_wait': 10,
+                                'log_level': 'INFO',
+                                'page_load_timeout': 60,
+                                'script_timeout': 30},
+    ('safari', 'mobile'): {   'browser': 'safari',
+                              'browser_options': {   'arguments': (),
+                                                     'auto_download': True,
+                                                     'disable_css': False,
+                                                     'disable_images': False,
+                                                     'disable_javascript': False,
+                                                     'experimental_options': {   'mobileEmulation': {   'deviceName': 'iPhone '
+                                                                                                                      '12 '
+                                                                                                                      'Pro'}},
+                                                     'headless': False,
+                                                     'start_maximized': False,
+                                                     'window_size': None},
+                              'driver_version': 'system',
+                              'enable_logging': True,
+                              'implicit_wait': 10,
+                              'log_level': 'INFO',
+                              'page_load_timeout': 60,
+                              'script_timeout': 30},
+    ('safari', 'performance'): {   'browser': 'safari',
+                                   'browser_options': {   'arguments': (   '--disable-extensions',
+                                                                           '--disable-plugins',
+                                                                           '--disable-infobars',
+                                                                           '--mute-audio'),
+                                                          'auto_download': True,
+                                                          'disable_css': False,
+                                                          'disable_images': True,
+                                                          'disable_javascript': False,
+                                                          'headless': False,
+                                                          'start_maximized': False,
+                                                          'window_size': None},
+                                   'driver_version': 'system',
+                                   'enable_logging': True,
+                                   'implicit_wait': 10,
+                                   'log_level': 'INFO',
+                                   'page_load_timeout': 60,
+                                   'script_timeout': 30},
+    ('safari', 'stealth'): {   'browser': 'safari',
+                               'browser_options': {   'arguments': (),
+                                                      'auto_download': True,
+                                                      'disable_css': False,
+                                                      'disable_images': False,
+                                                      'disable_javascript': False,
+                                                      'headless': False,
+                                                      'start_maximized': False,
+                                                      'window_size': None},
+                               'driver_version': 'system',
+                               'enable_logging': True,
+                               'implicit_wait': 10,
+                               'log_level': 'INFO',
+                               'page_load_timeout': 60,
+                               'script_timeout': 30,
+                               'stealth': {   'enabled': True,
+                                              'hide_webdriver': True,
+                                              'mask_fingerprint': True,
+                                              'randomize_audio': True,
+                                              'randomize_canvas': True,
+                                              'randomize_user_agent': True,
+                                              'randomize_webgl': True,
+                                              'remove_automation_flags': True}},
+    ('safari', 'testing'): {   'browser': 'safari',
+                               'browser_options': {   'arguments': (   '--no-sandbox',
+                                                                       '--disable-dev-shm-usage',
+                                                                       '--disable-gpu'),
+                                                      'auto_download': True,
+                                                      'disable_css': False,
+                                                      'disable_images': False,
+                                                      'disable_javascript': False,
+                                                      'headless': True,
+                                                      'start_maximized': False,
+                                                      'window_size': None},
+                               'driver_version': 'system',
+                               'enable_logging': True,
+                               'implicit_wait': 5.0,
+                               'log_level': 'INFO',
+                               'page_load_timeout': 30.0,
+                               'script_timeout': 30}}
+
+SCENARIOS = {   'bot': {   'browser': 'chrome',
+               'browser_options': {   'arguments': (   '--disable-blink-features=AutomationControlled',
+                                                       '--disable-dev-shm-usage',
+                                                       '--no-sandbox'),
+                                      'auto_download': True,
+                                      'disable_css': False,
+                                      'disable_images': False,
+                                      'disable_javascript': False,
+                                      'experimental_options': {   'excludeSwitches': (   'enable-automation',
+                                                                                         'enable-logging'),
+                                                                  'useAutomationExtension': False},
+                                      'headless': True,
+                                      'preferences': {   'credentials_enable_service': False,
+                                                         'profile.default_content_setting_values.notifications': 2,
+                                                         'profile.password_manager_enabled': False},
+                                      'start_maximized': False,
+                                      'window_size': None},
+               'driver_version': 'latest',
+               'enable_logging': True,
+               'implicit_wait': 10,
+               'log_level': 'INFO',
+               'page_load_timeout': 60,
+               'script_timeout': 30,
+               'stealth': {   'enabled': True,
+                              'hide_webdriver': True,
+                              'mask_fingerprint': True,
+                              'randomize_audio': True,
+                              'randomize_canvas': True,
+                              'randomize_user_agent': True,
+                              'randomize_webgl': True,
+                              'remove_automation_flags': True}},
+    'data-collection': {   'browser': 'chrome',
+                           'browser_options': {   'arguments': (   '--disable-extensions',
+                                                                   '--disable-plugins',
+                                                                   '--disable-infobars',
+                                                                   '--mute-audio'),
+                                                  'auto_download': True,
+                                                  'disable_css': False,
+                                                  'disable_images': True,
+                                                  'disable_javascript': False,
+                                                  'experimental_options': {   'excludeSwitches': (   'enable-automation',
+                                                                                                     'enable-logging'),
+                                                                              'useAutomationExtension': False},
+                                                  'headless': False,
+                                                  'preferences': {   'credentials_enable_service': False,
+                                                                     'profile.default_content_setting_values.notifications': 2,
+                                                                     'profile.password_manager_enabled': False},
+                                                  'start_maximized': False,
+                                                  'window_size': None},
+                           'driver_version': 'latest',
+                           'enable_logging': True,
+                           'implicit_wait': 10,
+                           'log_level': 'INFO',
+                           'page_load_timeout': 60,
+                           'script_timeout': 30},
+    'testing': {   'browser': 'chrome',
+                   'browser_options': {   'arguments': (   '--no-sandbox',
+                                                           '--disable-dev-shm-usage',
+                                                           '--disable-gpu'),
+                                          'auto_download': True,
+                                          'disable_css': False,
+                                          'disable_images': False,
+                                          'disable_javascript': False,
+                                          'experimental_options': {   'excludeSwitches': (   'enable-automation',
+                                                                                             'enable-logging'),
+                                                                      'useAutomationExtension': False},
+                                          'headless': True,
+                                          'preferences': {   'credentials_enable_service': False,
+                                                             'profile.default_content_setting_values.notifications': 2,
+                                                             'profile.password_manager_enabled': False},
+                                          'start_maximized': False,
+                                          'window_size': None},
+                   'driver_version': 'latest',
+                   'enable_logging': True,
+                   'implicit_wait': 5.0,
+                   'log_level': 'INFO',
+                   'page_load_timeout': 30.0,
+                   'script_timeout': 30},
+    'web-scraping': {   'browser': 'chrome',
+                        'browser_options': {   'arguments': (   '--disable-extensions',
+                                                                '--disable-plugins',
+                                                                '--disable-infobars',
+                                                                '--mute-audio'),
+                                               'auto_download': True,
+                                               'disable_css': False,
+                                               'disable_images': True,
+                                               'disable_javascript': False,
+                                               'experimental_options': {   'excludeSwitches': (   'enable-automation',
+                                                                                                  'enable-logging'),
+                                                                           'useAutomationExtension': False},
+                                               'headless': False,
+                                               'preferences': {   'credentials_enable_service': False,
+                                                                  'profile.default_content_setting_values.notifications': 2,
+                                                                  'profile.password_manager_enabled': False},
+                                               'start_maximized': False,
+                                               'window_size': None},
+                        'driver_version': 'latest',
+                        'enable_logging': True,
+                        'implicit_wait': 10,
+                        'log_level': 'INFO',
+                        'page_load_timeout': 60,
+                        'script_timeout': 30,
+                        'stealth': {   'enabled': True,
+                                       'hide_webdriver': True,
+                                       'mask_fingerprint': True,
+                                       'randomize_audio': True,
+                                       'randomize_canvas': True,
+                                       'randomize_user_agent': True,
+                                       'randomize_webgl': True,
+                                       'remove_automation_flags': True}}}
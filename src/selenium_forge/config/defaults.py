@@ -1,6 +1,9 @@
 """Default configurations for different browsers and scenarios."""
 
-from typing import Any, Dict
+import copy
+from functools import lru_cache
+from types import MappingProxyType, ModuleType
+from typing import Any, ClassVar, Dict, Mapping, Optional
 
 from selenium_forge.core.constants import (
     BrowserType,
@@ -10,11 +13,36 @@ from selenium_forge.core.constants import (
 )
 
 
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples.
+
+    The frozen constants can be shared by reference without defensive
+    copies; accidental mutation raises TypeError instead of silently
+    corrupting the defaults for the rest of the process.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Produce a mutable dict copy of a frozen config mapping.
+
+    Immutable leaves (tuples, strings, numbers) are shared rather than
+    copied.
+    """
+    if isinstance(value, Mapping):
+        return {k: _thaw(v) for k, v in value.items()}
+    return value
+
+
 class DefaultConfigs:
     """Default configurations for various scenarios."""
 
     # Base configuration applied to all browsers
-    BASE_CONFIG: Dict[str, Any] = {
+    BASE_CONFIG: Mapping[str, Any] = _freeze({
         "implicit_wait": DEFAULT_IMPLICIT_WAIT,
         "page_load_timeout": DEFAULT_PAGE_LOAD_TIMEOUT,
         "script_timeout": DEFAULT_SCRIPT_TIMEOUT,
@@ -29,10 +57,10 @@ class DefaultConfigs:
             "disable_css": False,
             "auto_download": True,
         },
-    }
+    })
 
     # Chrome-specific defaults
-    CHROME_CONFIG: Dict[str, Any] = {
+    CHROME_CONFIG: Mapping[str, Any] = _freeze({
         "browser": "chrome",
         "driver_version": "latest",
         "browser_options": {
@@ -51,10 +79,10 @@ class DefaultConfigs:
                 "useAutomationExtension": False,
             },
         },
-    }
+    })
 
     # Firefox-specific defaults
-    FIREFOX_CONFIG: Dict[str, Any] = {
+    FIREFOX_CONFIG: Mapping[str, Any] = _freeze({
         "browser": "firefox",
         "driver_version": "latest",
         "browser_options": {
@@ -66,10 +94,10 @@ class DefaultConfigs:
                 "dom.webnotifications.enabled": False,
             },
         },
-    }
+    })
 
     # Edge-specific defaults
-    EDGE_CONFIG: Dict[str, Any] = {
+    EDGE_CONFIG: Mapping[str, Any] = _freeze({
         "browser": "edge",
         "driver_version": "latest",
         "browser_options": {
@@ -85,19 +113,19 @@ class DefaultConfigs:
                 "useAutomationExtension": False,
             },
         },
-    }
+    })
 
     # Safari-specific defaults
-    SAFARI_CONFIG: Dict[str, Any] = {
+    SAFARI_CONFIG: Mapping[str, Any] = _freeze({
         "browser": "safari",
         "driver_version": "system",
         "browser_options": {
             "arguments": [],
         },
-    }
+    })
 
     # Headless configuration (overlay)
-    HEADLESS_CONFIG: Dict[str, Any] = {
+    HEADLESS_CONFIG: Mapping[str, Any] = _freeze({
         "browser_options": {
             "headless": True,
             "arguments": [
@@ -105,10 +133,10 @@ class DefaultConfigs:
                 "--disable-gpu",
             ],
         },
-    }
+    })
 
     # Stealth mode configuration
-    STEALTH_CONFIG: Dict[str, Any] = {
+    STEALTH_CONFIG: Mapping[str, Any] = _freeze({
         "stealth": {
             "enabled": True,
             "hide_webdriver": True,
@@ -119,10 +147,10 @@ class DefaultConfigs:
             "randomize_webgl": True,
             "randomize_audio": True,
         },
-    }
+    })
 
     # Performance optimized configuration
-    PERFORMANCE_CONFIG: Dict[str, Any] = {
+    PERFORMANCE_CONFIG: Mapping[str, Any] = _freeze({
         "browser_options": {
             "disable_images": True,
             "disable_css": False,
@@ -133,10 +161,10 @@ class DefaultConfigs:
                 "--mute-audio",
             ],
         },
-    }
+    })
 
     # Testing configuration
-    TESTING_CONFIG: Dict[str, Any] = {
+    TESTING_CONFIG: Mapping[str, Any] = _freeze({
         "browser_options": {
             "headless": True,
             "arguments": [
@@ -147,10 +175,10 @@ class DefaultConfigs:
         },
         "implicit_wait": 5.0,
         "page_load_timeout": 30.0,
-    }
+    })
 
     # Mobile emulation configuration
-    MOBILE_CONFIG: Dict[str, Any] = {
+    MOBILE_CONFIG: Mapping[str, Any] = _freeze({
         "browser_options": {
             "experimental_options": {
                 "mobileEmulation": {
@@ -158,6 +186,16 @@ class DefaultConfigs:
                 },
             },
         },
+    })
+
+    # Browser-name dispatch table, built once at class creation so
+    # get_browser_defaults doesn't allocate a fresh dict per call
+    _BROWSER_DISPATCH: ClassVar[Dict[str, Mapping[str, Any]]] = {
+        "chrome": CHROME_CONFIG,
+        "firefox": FIREFOX_CONFIG,
+        "edge": EDGE_CONFIG,
+        "safari": SAFARI_CONFIG,
+        "chromium": CHROME_CONFIG,  # Use Chrome config for Chromium
     }
 
     @staticmethod
@@ -170,25 +208,8 @@ class DefaultConfigs:
         Returns:
             Default configuration dictionary
         """
-        browser = browser.lower()
-
-        # Get browser-specific config
-        browser_configs = {
-            "chrome": DefaultConfigs.CHROME_CONFIG,
-            "firefox": DefaultConfigs.FIREFOX_CONFIG,
-            "edge": DefaultConfigs.EDGE_CONFIG,
-            "safari": DefaultConfigs.SAFARI_CONFIG,
-            "chromium": DefaultConfigs.CHROME_CONFIG,  # Use Chrome config for Chromium
-        }
-
-        browser_config = browser_configs.get(browser, DefaultConfigs.CHROME_CONFIG)
-
-        # Merge with base config
-        from selenium_forge.config.loader import ConfigLoader
-
-        return ConfigLoader.merge_configs(
-            DefaultConfigs.BASE_CONFIG.copy(), browser_config
-        )
+        # Merging is cached; deep-copy so callers can mutate the result safely
+        return copy.deepcopy(_cached_browser_defaults(browser.lower()))
 
     @staticmethod
     def get_preset_config(preset: str, browser: str = "chrome") -> Dict[str, Any]:
@@ -201,25 +222,7 @@ class DefaultConfigs:
         Returns:
             Preset configuration dictionary
         """
-        from selenium_forge.config.loader import ConfigLoader
-
-        # Start with browser defaults
-        config = DefaultConfigs.get_browser_defaults(browser)
-
-        # Apply preset overlay
-        preset = preset.lower()
-        preset_configs = {
-            "headless": DefaultConfigs.HEADLESS_CONFIG,
-            "stealth": DefaultConfigs.STEALTH_CONFIG,
-            "performance": DefaultConfigs.PERFORMANCE_CONFIG,
-            "testing": DefaultConfigs.TESTING_CONFIG,
-            "mobile": DefaultConfigs.MOBILE_CONFIG,
-        }
-
-        if preset in preset_configs:
-            config = ConfigLoader.merge_configs(config, preset_configs[preset])
-
-        return config
+        return copy.deepcopy(_cached_preset_config(preset.lower(), browser.lower()))
 
     @staticmethod
     def get_scenario_config(scenario: str) -> Dict[str, Any]:
@@ -231,52 +234,150 @@ class DefaultConfigs:
         Returns:
             Scenario-specific configuration
         """
-        from selenium_forge.config.loader import ConfigLoader
-
-        scenario = scenario.lower()
-
-        if scenario == "web-scraping":
-            # Optimized for web scraping
-            return ConfigLoader.merge_configs(
-                DefaultConfigs.get_browser_defaults("chrome"),
-                DefaultConfigs.STEALTH_CONFIG,
-                DefaultConfigs.PERFORMANCE_CONFIG,
-            )
-
-        elif scenario == "testing":
-            # Optimized for automated testing
-            return ConfigLoader.merge_configs(
-                DefaultConfigs.get_browser_defaults("chrome"),
-                DefaultConfigs.TESTING_CONFIG,
-            )
-
-        elif scenario == "bot":
-            # Optimized for bot operations
-            return ConfigLoader.merge_configs(
-                DefaultConfigs.get_browser_defaults("chrome"),
-                DefaultConfigs.STEALTH_CONFIG,
-                {
-                    "browser_options": {
-                        "headless": True,
-                    },
+        return copy.deepcopy(_cached_scenario_config(scenario.lower()))
+
+
+# ================================================================
+# Cached merge helpers
+# ================================================================
+
+# The *_CONFIG class dicts are effectively immutable inputs, so the merged
+# results are pure functions of the (lower-cased) string arguments. Caching
+# them avoids re-running the recursive merges on hot paths such as
+# driver-per-URL scraping loops; the public staticmethods deep-copy on return.
+
+
+def _merge_into(dst: Dict[str, Any], src: Mapping[str, Any]) -> None:
+    """Merge ``src`` into ``dst`` in place, recursing into nested dicts.
+
+    Unlike ``ConfigLoader.merge_configs``, this allocates no intermediate
+    dicts, so overlaying N configs costs one deepcopy of the base plus N
+    in-place walks.
+    """
+    for key, value in src.items():
+        if isinstance(dst.get(key), dict) and isinstance(value, Mapping):
+            _merge_into(dst[key], value)
+        elif isinstance(value, Mapping):
+            dst[key] = _thaw(value)
+        else:
+            dst[key] = value
+
+
+@lru_cache(maxsize=1)
+def _load_precomputed() -> Optional[ModuleType]:
+    """Load the build-time merged-config cache, if present and current.
+
+    ``tools/build_defaults_cache.py`` ships every merged (browser, preset)
+    and scenario combination as literals in ``_precomputed.py`` so steady
+    state skips runtime merging entirely. A content hash of this module
+    guards against a stale cache after edits to the defaults.
+
+    Returns:
+        The ``_precomputed`` module, or None if missing or stale
+    """
+    try:
+        from selenium_forge.config import _precomputed
+    except ImportError:
+        return None
+
+    import hashlib
+
+    with open(__file__, "rb") as f:
+        source_hash = hashlib.sha256(f.read()).hexdigest()
+
+    if source_hash != _precomputed.SOURCE_HASH:
+        return None  # Stale cache; fall back to runtime merging
+
+    return _precomputed
+
+
+@lru_cache(maxsize=None)
+def _cached_browser_defaults(browser: str) -> Dict[str, Any]:
+    """Merge base and browser-specific defaults (cached)."""
+    browser_config = DefaultConfigs._BROWSER_DISPATCH.get(
+        browser, DefaultConfigs.CHROME_CONFIG
+    )
+
+    # Merge with base config
+    result = _thaw(DefaultConfigs.BASE_CONFIG)
+    _merge_into(result, browser_config)
+    return result
+
+
+@lru_cache(maxsize=None)
+def _cached_preset_config(preset: str, browser: str) -> Dict[str, Any]:
+    """Merge browser defaults with a preset overlay (cached)."""
+    precomputed = _load_precomputed()
+    if precomputed is not None:
+        hit = precomputed.PRESETS.get((browser, preset))
+        if hit is not None:
+            return hit
+
+    # Start with browser defaults (copied so the cached entry stays pristine)
+    config = copy.deepcopy(_cached_browser_defaults(browser))
+
+    # Apply preset overlay
+    preset_configs = {
+        "headless": DefaultConfigs.HEADLESS_CONFIG,
+        "stealth": DefaultConfigs.STEALTH_CONFIG,
+        "performance": DefaultConfigs.PERFORMANCE_CONFIG,
+        "testing": DefaultConfigs.TESTING_CONFIG,
+        "mobile": DefaultConfigs.MOBILE_CONFIG,
+    }
+
+    if preset in preset_configs:
+        _merge_into(config, preset_configs[preset])
+
+    return config
+
+
+@lru_cache(maxsize=None)
+def _cached_scenario_config(scenario: str) -> Dict[str, Any]:
+    """Merge scenario-specific overlays (cached)."""
+    precomputed = _load_precomputed()
+    if precomputed is not None:
+        hit = precomputed.SCENARIOS.get(scenario)
+        if hit is not None:
+            return hit
+
+    if scenario == "web-scraping":
+        # Optimized for web scraping
+        overlays = (
+            DefaultConfigs.STEALTH_CONFIG,
+            DefaultConfigs.PERFORMANCE_CONFIG,
+        )
+
+    elif scenario == "testing":
+        # Optimized for automated testing
+        overlays = (DefaultConfigs.TESTING_CONFIG,)
+
+    elif scenario == "bot":
+        # Optimized for bot operations
+        overlays = (
+            DefaultConfigs.STEALTH_CONFIG,
+            {
+                "browser_options": {
+                    "headless": True,
                 },
-            )
-
-        elif scenario == "data-collection":
-            # Optimized for data collection
-            return ConfigLoader.merge_configs(
-                DefaultConfigs.get_browser_defaults("chrome"),
-                DefaultConfigs.PERFORMANCE_CONFIG,
-                {
-                    "browser_options": {
-                        "disable_images": True,
-                    },
+            },
+        )
+
+    elif scenario == "data-collection":
+        # Optimized for data collection
+        overlays = (
+            DefaultConfigs.PERFORMANCE_CONFIG,
+            {
+                "browser_options": {
+                    "disable_images": True,
                 },
-            )
+            },
+        )
 
-        else:
-            # Default to Chrome with stealth
-            return ConfigLoader.merge_configs(
-                DefaultConfigs.get_browser_defaults("chrome"),
-                DefaultConfigs.STEALTH_CONFIG,
-            )
+    else:
+        # Default to Chrome with stealth
+        overlays = (DefaultConfigs.STEALTH_CONFIG,)
+
+    config = copy.deepcopy(_cached_browser_defaults("chrome"))
+    for overlay in overlays:
+        _merge_into(config, overlay)
+    return config
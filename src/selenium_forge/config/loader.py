@@ -2,10 +2,20 @@
 
 from __future__ import annotations
 
+import os
+from collections import deque
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
+from types import ModuleType
 from typing import Any, Dict, Optional
 
-import yaml
+try:
+    # orjson parses roughly an order of magnitude faster than the stdlib;
+    # both are far faster than routing JSON through the YAML scanner
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 from selenium_forge.core.platform import PlatformDetector
 from selenium_forge.core.types import DriverConfig
@@ -13,6 +23,149 @@ from selenium_forge.exceptions import UserError
 from selenium_forge.config.schema import ConfigSchema
 
 
+# PyYAML is imported lazily: its import cost (regex tables, C-extension
+# binding) is pure startup tax for commands that never touch YAML, such
+# as --help or JSON-only config loads.
+_yaml = None
+_SafeLoader: Any = None
+_SafeDumper: Any = None
+
+
+def _get_yaml() -> ModuleType:
+    """Import PyYAML on first use, resolving the fastest loader/dumper."""
+    global _yaml, _SafeLoader, _SafeDumper
+    if _yaml is None:
+        import yaml
+
+        try:
+            # libyaml C bindings: same output as SafeLoader/SafeDumper,
+            # several times faster
+            from yaml import CSafeDumper as _SafeDumper
+            from yaml import CSafeLoader as _SafeLoader
+        except ImportError:
+            from yaml import SafeDumper as _SafeDumper
+            from yaml import SafeLoader as _SafeLoader
+
+        _yaml = yaml
+    return _yaml
+
+
+# Field tuples + attrgetters for config_to_dict: one tight zip() per
+# section instead of a hand-written LOAD_ATTR/STORE_SUBSCR pair per field
+_BROWSER_OPT_FIELDS = (
+    "headless",
+    "window_size",
+    "start_maximized",
+    "binary_location",
+    "profile_directory",
+    "extensions",
+    "disable_images",
+    "disable_javascript",
+    "download_directory",
+    "arguments",
+    "preferences",
+)
+_BROWSER_OPT_GETTER = attrgetter(*_BROWSER_OPT_FIELDS)
+
+_STEALTH_FIELDS = (
+    "enabled",
+    "hide_webdriver",
+    "randomize_user_agent",
+    "mask_fingerprint",
+    "remove_automation_flags",
+    "custom_user_agent",
+    "randomize_canvas",
+    "randomize_webgl",
+)
+_STEALTH_GETTER = attrgetter(*_STEALTH_FIELDS)
+
+# Template skeletons for create_template_config, built once at import.
+# Deep-copied per call so the constants stay pristine; the browser key is
+# filled in from the argument.
+_BASE_TEMPLATE: Dict[str, Any] = {
+    "browser": None,
+    "driver_version": "latest",
+    "browser_options": {
+        "headless": False,
+        "start_maximized": True,
+        "window_size": None,
+    },
+}
+
+_ADVANCED_TEMPLATE: Dict[str, Any] = {
+    "browser": None,
+    "driver_version": "latest",
+    "browser_options": {
+        "headless": False,
+        "start_maximized": True,
+        "window_size": None,
+        "disable_images": False,
+        "disable_javascript": False,
+        "download_directory": None,
+        "arguments": [],
+        "preferences": {},
+    },
+    "stealth": {
+        "enabled": False,
+        "hide_webdriver": True,
+        "randomize_user_agent": True,
+        "mask_fingerprint": True,
+    },
+    "proxy": {
+        "host": "proxy.example.com",
+        "port": 8080,
+        "type": "http",
+        "username": None,
+        "password": None,
+    },
+    "implicit_wait": 10.0,
+    "page_load_timeout": 60.0,
+    "script_timeout": 30.0,
+    "log_level": "INFO",
+}
+
+
+@lru_cache(maxsize=128)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file, memoized on (path, mtime, size).
+
+    Repeated loads of an unchanged file (CI loops validating many configs,
+    template regeneration) hit the cache instead of re-parsing; any write
+    to the file changes mtime/size and naturally invalidates the entry.
+
+    The file is read as bytes: the YAML scanner handles UTF-8 directly, so
+    decoding to an intermediate str first would be a redundant pass.
+
+    ``.json`` files take a native JSON parser fast path — JSON is a strict
+    subset of YAML, so this is a pure speedup with identical results.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    # yaml chokes on an explicit UTF-8 BOM in byte input
+    if data.startswith(b"\xef\xbb\xbf"):
+        data = data[3:]
+
+    if path.endswith(".json"):
+        try:
+            return _json_loads(data)
+        except ValueError:
+            pass  # Not actually JSON; let the YAML parser report it
+
+    yaml = _get_yaml()
+    return yaml.load(data, Loader=_SafeLoader)
+
+
+@lru_cache(maxsize=None)
+def _user_config_path(filename: str) -> Path:
+    """Resolve the per-user config file path (cached).
+
+    Config-dir discovery stats and creates platform directories; the
+    location cannot move mid-process, so compute it once per filename.
+    """
+    return PlatformDetector.get_config_dir() / filename
+
+
 class ConfigLoader:
     """Loads and merges configuration from multiple sources."""
 
@@ -20,6 +173,10 @@ class ConfigLoader:
     def load_yaml(file_path: Path) -> Dict[str, Any]:
         """Load configuration from YAML file.
 
+        Results are cached per (path, mtime, size), so the returned dict may
+        be shared between callers: treat it as read-only and merge into a
+        fresh dict (e.g. via merge_configs) rather than mutating it.
+
         Args:
             file_path: Path to YAML configuration file
 
@@ -41,9 +198,12 @@ class ConfigLoader:
                 suggestion="Provide a path to a YAML configuration file",
             )
 
+        yaml = _get_yaml()
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                config_data = yaml.safe_load(f)
+            stat_result = file_path.stat()
+            config_data = _load_yaml_cached(
+                str(file_path), stat_result.st_mtime_ns, stat_result.st_size
+            )
 
             if config_data is None:
                 raise UserError(
@@ -71,6 +231,133 @@ class ConfigLoader:
                 cause=e,
             )
 
+    @staticmethod
+    def load_yaml_header(
+        file_path: Path,
+        max_lines: int = 64,
+    ) -> Dict[str, Any]:
+        """Load only the leading portion of a YAML configuration file.
+
+        Useful when a caller just needs a top-level field (e.g. ``browser``)
+        from a potentially large file: only the first ``max_lines`` lines
+        are read and parsed. If the truncated document does not parse
+        cleanly, falls back to a full load_yaml.
+
+        Args:
+            file_path: Path to YAML configuration file
+            max_lines: Maximum number of lines to read
+
+        Returns:
+            Configuration dictionary (may be partial for long files)
+
+        Raises:
+            UserError: If file cannot be loaded or parsed
+        """
+        from itertools import islice
+
+        try:
+            with open(file_path, "rb") as f:
+                head = b"".join(islice(f, max_lines))
+        except OSError:
+            return ConfigLoader.load_yaml(file_path)
+
+        if head.startswith(b"\xef\xbb\xbf"):
+            head = head[3:]
+
+        yaml = _get_yaml()
+        try:
+            config_data = yaml.load(head, Loader=_SafeLoader)
+        except yaml.YAMLError:
+            # Truncation likely split a block mid-structure
+            return ConfigLoader.load_yaml(file_path)
+
+        if not isinstance(config_data, dict):
+            return ConfigLoader.load_yaml(file_path)
+
+        return config_data
+
+    @staticmethod
+    def quick_fields(file_path: Path, fields: set) -> Dict[str, Any]:
+        """Extract top-level scalar fields without building the full document.
+
+        Walks the low-level parser event stream and picks out the requested
+        keys, stopping as soon as all of them are seen. Nested structures
+        (``browser_options``, long extension lists) are never materialized
+        as Python objects, so this stays cheap on large configs when a
+        caller only needs e.g. ``browser`` or ``driver_version``.
+
+        Args:
+            file_path: Path to YAML configuration file
+            fields: Top-level keys to extract
+
+        Returns:
+            Mapping of found field names to their scalar values; requested
+            fields that are absent or non-scalar are omitted
+
+        Raises:
+            UserError: If the file cannot be loaded or parsed
+        """
+        yaml = _get_yaml()
+        wanted = set(fields)
+        found: Dict[str, Any] = {}
+
+        scalar_event = yaml.events.ScalarEvent
+        start_events = (yaml.events.MappingStartEvent, yaml.events.SequenceStartEvent)
+        end_events = (yaml.events.MappingEndEvent, yaml.events.SequenceEndEvent)
+
+        try:
+            with open(file_path, "rb") as f:
+                depth = 0
+                key = None
+                for event in yaml.parse(f, Loader=_SafeLoader):
+                    if isinstance(event, scalar_event):
+                        if depth != 1:
+                            continue
+                        if key is None:
+                            key = event.value
+                            continue
+                        if key in wanted and key not in found:
+                            if event.style:
+                                # Quoted or block scalar: always a string
+                                found[key] = event.value
+                            else:
+                                # Plain scalar: resolve int/float/bool/null
+                                # the same way a full load would
+                                found[key] = yaml.load(
+                                    event.value, Loader=_SafeLoader
+                                )
+                            if len(found) == len(wanted):
+                                break
+                        key = None
+                    elif isinstance(event, start_events):
+                        if depth == 1:
+                            key = None  # Structured value; not extractable
+                        depth += 1
+                    elif isinstance(event, end_events):
+                        depth -= 1
+        except yaml.YAMLError as e:
+            raise UserError(
+                f"Invalid YAML syntax in configuration file: {e}",
+                cause=e,
+                suggestion="Check YAML syntax using a YAML validator",
+            )
+        except OSError as e:
+            raise UserError(
+                f"Failed to load configuration file: {e}",
+                cause=e,
+            )
+
+        return found
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop all cached YAML parses.
+
+        Useful in long-running processes that know a config file changed
+        without its mtime advancing (e.g. clock skew on network mounts).
+        """
+        _load_yaml_cached.cache_clear()
+
     @staticmethod
     def save_yaml(config_data: Dict[str, Any], file_path: Path) -> None:
         """Save configuration to YAML file.
@@ -82,14 +369,16 @@ class ConfigLoader:
         Raises:
             UserError: If file cannot be written
         """
+        yaml = _get_yaml()
         try:
             # Create parent directory if it doesn't exist
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
             with open(file_path, "w", encoding="utf-8") as f:
-                yaml.safe_dump(
+                yaml.dump(
                     config_data,
                     f,
+                    Dumper=_SafeDumper,
                     default_flow_style=False,
                     sort_keys=False,
                     allow_unicode=True,
@@ -108,6 +397,12 @@ class ConfigLoader:
         Later configurations override earlier ones. Nested dictionaries
         are merged recursively.
 
+        Input dictionaries are never mutated. Nested dictionaries are
+        copied lazily (copy-on-write): a nested dict that only one source
+        contributes is shared by reference in the result, so treat the
+        inputs as frozen afterwards — consistent with load_yaml's shared
+        cached results.
+
         Args:
             *configs: Configuration dictionaries to merge
 
@@ -116,21 +411,34 @@ class ConfigLoader:
         """
         merged: Dict[str, Any] = {}
 
-        for config in configs:
-            if config is None:
-                continue
-
-            for key, value in config.items():
-                if (
-                    key in merged
-                    and isinstance(merged[key], dict)
-                    and isinstance(value, dict)
-                ):
-                    # Recursively merge nested dictionaries
-                    merged[key] = ConfigLoader.merge_configs(merged[key], value)
+        # Dicts the accumulator owns (allocated here, safe to mutate).
+        # Anything else reachable from `merged` is still aliased to an
+        # input and must be shallow-copied before the first write into it.
+        owned = {id(merged)}
+
+        # Iterative breadth-first merge: mutate a single accumulator instead
+        # of allocating an intermediate dict per nested key per overlay.
+        # FIFO order preserves the later-overrides-earlier semantics at
+        # every nesting level.
+        pending = deque((merged, config) for config in configs if config)
+
+        while pending:
+            dst, src = pending.popleft()
+            for key, value in src.items():
+                if isinstance(value, dict):
+                    current = dst.get(key)
+                    if not isinstance(current, dict):
+                        # First source to supply this subtree: share it
+                        # by reference, copy only if merged into later
+                        dst[key] = value
+                        continue
+                    if id(current) not in owned:
+                        current = dst[key] = dict(current)
+                        owned.add(id(current))
+                    pending.append((current, value))
                 else:
                     # Override with new value
-                    merged[key] = value
+                    dst[key] = value
 
         return merged
 
@@ -192,27 +500,36 @@ class ConfigLoader:
         if start_dir is None:
             start_dir = Path.cwd()
 
-        # Search upwards from start directory
-        current_dir = start_dir.resolve()
-        while True:
-            config_file = current_dir / filename
-            if config_file.exists() and config_file.is_file():
-                return config_file
+        hidden_filename = f".{filename}"
+
+        # Search upwards from start directory. One scandir per level (a
+        # single readdir batch) replaces four stat() calls on mostly
+        # non-existent paths. The parent chain is precomputed so the loop
+        # needs no per-level .parent comparison to detect the root.
+        resolved = start_dir.resolve()
+        for current_dir in (resolved, *resolved.parents):
+            found = set()
+            try:
+                with os.scandir(current_dir) as entries:
+                    for entry in entries:
+                        if entry.name in (filename, hidden_filename):
+                            try:
+                                if entry.is_file():
+                                    found.add(entry.name)
+                            except OSError:
+                                continue
+            except OSError:
+                pass  # Unreadable directory; keep walking up
+
+            if filename in found:
+                return current_dir / filename
 
             # Check for hidden version
-            hidden_config = current_dir / f".{filename}"
-            if hidden_config.exists() and hidden_config.is_file():
-                return hidden_config
-
-            # Move to parent directory
-            parent = current_dir.parent
-            if parent == current_dir:
-                # Reached root
-                break
-            current_dir = parent
+            if hidden_filename in found:
+                return current_dir / hidden_filename
 
         # Check user config directory
-        user_config = PlatformDetector.get_config_dir() / filename
+        user_config = _user_config_path(filename)
         if user_config.exists() and user_config.is_file():
             return user_config
 
@@ -234,54 +551,14 @@ class ConfigLoader:
         Raises:
             UserError: If template cannot be created
         """
-        from selenium_forge.config.defaults import DefaultConfigs
-
-        # Get default config for browser
-        defaults = DefaultConfigs.get_browser_defaults(browser)
-
-        # Create template structure
-        template: Dict[str, Any] = {
-            "browser": browser,
-            "driver_version": "latest",
-            "browser_options": {
-                "headless": False,
-                "start_maximized": True,
-                "window_size": None,
-            },
-        }
-
-        if include_advanced:
-            template["browser_options"].update(
-                {
-                    "disable_images": False,
-                    "disable_javascript": False,
-                    "download_directory": None,
-                    "arguments": [],
-                    "preferences": {},
-                }
-            )
+        import copy
 
-            template.update(
-                {
-                    "stealth": {
-                        "enabled": False,
-                        "hide_webdriver": True,
-                        "randomize_user_agent": True,
-                        "mask_fingerprint": True,
-                    },
-                    "proxy": {
-                        "host": "proxy.example.com",
-                        "port": 8080,
-                        "type": "http",
-                        "username": None,
-                        "password": None,
-                    },
-                    "implicit_wait": 10.0,
-                    "page_load_timeout": 60.0,
-                    "script_timeout": 30.0,
-                    "log_level": "INFO",
-                }
-            )
+        # Copy the precomputed skeleton instead of rebuilding the nested
+        # literals on every call
+        template = copy.deepcopy(
+            _ADVANCED_TEMPLATE if include_advanced else _BASE_TEMPLATE
+        )
+        template["browser"] = browser
 
         ConfigLoader.save_yaml(template, output_path)
 
@@ -306,19 +583,9 @@ class ConfigLoader:
         }
 
         # Browser options
-        result["browser_options"] = {
-            "headless": config.browser_options.headless,
-            "window_size": config.browser_options.window_size,
-            "start_maximized": config.browser_options.start_maximized,
-            "binary_location": config.browser_options.binary_location,
-            "profile_directory": config.browser_options.profile_directory,
-            "extensions": config.browser_options.extensions,
-            "disable_images": config.browser_options.disable_images,
-            "disable_javascript": config.browser_options.disable_javascript,
-            "download_directory": config.browser_options.download_directory,
-            "arguments": config.browser_options.arguments,
-            "preferences": config.browser_options.preferences,
-        }
+        result["browser_options"] = dict(
+            zip(_BROWSER_OPT_FIELDS, _BROWSER_OPT_GETTER(config.browser_options))
+        )
 
         # Proxy configuration
         if config.proxy:
@@ -333,15 +600,8 @@ class ConfigLoader:
 
         # Stealth configuration
         if config.stealth:
-            result["stealth"] = {
-                "enabled": config.stealth.enabled,
-                "hide_webdriver": config.stealth.hide_webdriver,
-                "randomize_user_agent": config.stealth.randomize_user_agent,
-                "mask_fingerprint": config.stealth.mask_fingerprint,
-                "remove_automation_flags": config.stealth.remove_automation_flags,
-                "custom_user_agent": config.stealth.custom_user_agent,
-                "randomize_canvas": config.stealth.randomize_canvas,
-                "randomize_webgl": config.stealth.randomize_webgl,
-            }
+            result["stealth"] = dict(
+                zip(_STEALTH_FIELDS, _STEALTH_GETTER(config.stealth))
+            )
 
         return result
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, FrozenSet, List
 
 from selenium_forge.core.constants import BrowserType, ProxyType
 from selenium_forge.core.types import (
@@ -13,6 +13,19 @@ from selenium_forge.core.types import (
 )
 from selenium_forge.exceptions import UserError
 
+# Shared type tuples for the hot isinstance checks in the validators
+_NUMBER_TYPES = (int, float)
+_SEQ_TYPES = (list, tuple)
+
+
+def _validate_nonneg_num(field: str, value: Any) -> None:
+    """Validate that a timeout-style field is a non-negative number."""
+    if not isinstance(value, _NUMBER_TYPES) or value < 0:
+        raise UserError(
+            f"Invalid {field}: {value}",
+            suggestion=f"{field} must be a non-negative number",
+        )
+
 
 class ConfigSchema:
     """Configuration schema definition and validation."""
@@ -22,14 +35,31 @@ class ConfigSchema:
     OPTIONAL_FIELDS: Dict[str, type] = {
         "driver_version": str,
         "driver_path": str,
-        "implicit_wait": (int, float),
-        "page_load_timeout": (int, float),
-        "script_timeout": (int, float),
+        "implicit_wait": _NUMBER_TYPES,
+        "page_load_timeout": _NUMBER_TYPES,
+        "script_timeout": _NUMBER_TYPES,
         "log_level": str,
         "enable_logging": bool,
     }
 
-    VALID_LOG_LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+    VALID_LOG_LEVELS: FrozenSet[str] = frozenset(
+        ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+    )
+
+    # Per-field scalar validators, built once so validate_config can make a
+    # single dispatching pass instead of a get()+isinstance pair per field
+    _SCALAR_VALIDATORS: Dict[str, Callable[[str, Any], None]] = {
+        "implicit_wait": _validate_nonneg_num,
+        "page_load_timeout": _validate_nonneg_num,
+        "script_timeout": _validate_nonneg_num,
+    }
+
+    # Precomputed enum lookup tables: a dict hit is much cheaper than the
+    # Enum value-lookup protocol, and the error suggestions never change
+    _BROWSER_BY_NAME: Dict[str, BrowserType] = {b.value: b for b in BrowserType}
+    _PROXY_BY_NAME: Dict[str, ProxyType] = {p.value: p for p in ProxyType}
+    _BROWSER_SUGGESTION = f"Valid browsers: {', '.join(b.value for b in BrowserType)}"
+    _PROXY_SUGGESTION = f"Valid proxy types: {', '.join(p.value for p in ProxyType)}"
 
     @staticmethod
     def validate_browser_type(browser: str) -> BrowserType:
@@ -44,14 +74,13 @@ class ConfigSchema:
         Raises:
             UserError: If browser type is invalid
         """
-        try:
-            return BrowserType(browser.lower())
-        except ValueError:
-            valid_browsers = [b.value for b in BrowserType]
+        browser_type = ConfigSchema._BROWSER_BY_NAME.get(browser.lower())
+        if browser_type is None:
             raise UserError(
                 f"Invalid browser type: {browser}",
-                suggestion=f"Valid browsers: {', '.join(valid_browsers)}",
+                suggestion=ConfigSchema._BROWSER_SUGGESTION,
             )
+        return browser_type
 
     @staticmethod
     def validate_proxy_config(proxy_data: Dict[str, Any]) -> ProxyConfig:
@@ -76,13 +105,11 @@ class ConfigSchema:
 
         # Validate proxy type
         proxy_type_str = proxy_data.get("type", "http")
-        try:
-            proxy_type = ProxyType(proxy_type_str.lower())
-        except ValueError:
-            valid_types = [t.value for t in ProxyType]
+        proxy_type = ConfigSchema._PROXY_BY_NAME.get(proxy_type_str.lower())
+        if proxy_type is None:
             raise UserError(
                 f"Invalid proxy type: {proxy_type_str}",
-                suggestion=f"Valid proxy types: {', '.join(valid_types)}",
+                suggestion=ConfigSchema._PROXY_SUGGESTION,
             )
 
         # Validate port
@@ -166,7 +193,7 @@ class ConfigSchema:
         # Validate window size
         window_size = options_data.get("window_size")
         if window_size is not None:
-            if not isinstance(window_size, (list, tuple)) or len(window_size) != 2:
+            if not isinstance(window_size, _SEQ_TYPES) or len(window_size) != 2:
                 raise UserError(
                     f"Invalid window_size: {window_size}",
                     suggestion="window_size must be a list of two integers: [width, height]",
@@ -178,9 +205,9 @@ class ConfigSchema:
                 )
             window_size = tuple(window_size)
 
-        # Validate extensions
+        # Validate extensions (defaults store sequences as tuples, so accept both)
         extensions = options_data.get("extensions", [])
-        if not isinstance(extensions, list):
+        if not isinstance(extensions, _SEQ_TYPES):
             raise UserError(
                 "Extensions must be a list of file paths",
                 suggestion="Example: extensions: ['/path/to/ext1.crx', '/path/to/ext2.crx']",
@@ -192,7 +219,7 @@ class ConfigSchema:
             start_maximized=options_data.get("start_maximized", False),
             binary_location=options_data.get("binary_location"),
             profile_directory=options_data.get("profile_directory"),
-            extensions=extensions,
+            extensions=list(extensions),
             disable_images=options_data.get("disable_images", False),
             disable_javascript=options_data.get("disable_javascript", False),
             disable_css=options_data.get("disable_css", False),
@@ -200,7 +227,7 @@ class ConfigSchema:
             download_directory=options_data.get("download_directory"),
             auto_download=options_data.get("auto_download", True),
             experimental_options=options_data.get("experimental_options", {}),
-            arguments=options_data.get("arguments", []),
+            arguments=list(options_data.get("arguments", ())),
             preferences=options_data.get("preferences", {}),
         )
 
@@ -242,23 +269,21 @@ class ConfigSchema:
         if "stealth" in config_data and config_data["stealth"]:
             stealth = ConfigSchema.validate_stealth_config(config_data["stealth"])
 
-        # Validate log level
-        log_level = config_data.get("log_level", "INFO")
-        if log_level.upper() not in ConfigSchema.VALID_LOG_LEVELS:
+        # Validate log level (normalize once, reusing the raw value for errors)
+        raw_log_level = config_data.get("log_level", "INFO")
+        log_level = raw_log_level.upper()
+        if log_level not in ConfigSchema.VALID_LOG_LEVELS:
             raise UserError(
-                f"Invalid log level: {log_level}",
-                suggestion=f"Valid log levels: {', '.join(ConfigSchema.VALID_LOG_LEVELS)}",
+                f"Invalid log level: {raw_log_level}",
+                suggestion=f"Valid log levels: {', '.join(sorted(ConfigSchema.VALID_LOG_LEVELS))}",
             )
 
-        # Validate timeouts
-        for timeout_field in ["implicit_wait", "page_load_timeout", "script_timeout"]:
-            timeout_value = config_data.get(timeout_field)
-            if timeout_value is not None:
-                if not isinstance(timeout_value, (int, float)) or timeout_value < 0:
-                    raise UserError(
-                        f"Invalid {timeout_field}: {timeout_value}",
-                        suggestion=f"{timeout_field} must be a non-negative number",
-                    )
+        # Validate scalar fields in one dispatching pass
+        validators = ConfigSchema._SCALAR_VALIDATORS
+        for key, value in config_data.items():
+            validator = validators.get(key)
+            if validator is not None and value is not None:
+                validator(key, value)
 
         return DriverConfig(
             browser=browser,
@@ -271,7 +296,7 @@ class ConfigSchema:
             page_load_timeout=config_data.get("page_load_timeout", 60.0),
             script_timeout=config_data.get("script_timeout", 30.0),
             capabilities=config_data.get("capabilities", {}),
-            log_level=log_level.upper(),
+            log_level=log_level,
             enable_logging=config_data.get("enable_logging", True),
         )
 
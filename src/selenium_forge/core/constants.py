@@ -1,7 +1,7 @@
 """Constants and enumerations for selenium-forge."""
 
 from enum import Enum
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 
 class BrowserType(str, Enum):
@@ -166,6 +166,31 @@ BROWSER_PATHS: Dict[OperatingSystem, Dict[BrowserType, List[str]]] = {
     },
 }
 
+# Flattened lookup table built once from the literal above: one dict hit
+# on an (os, browser) pair instead of two nested gets, with frozen tuples
+# so candidate lists are never reallocated or accidentally mutated
+_BROWSER_PATHS_FLAT: Dict[Tuple[OperatingSystem, BrowserType], Tuple[str, ...]] = {
+    (os_type, browser): tuple(paths)
+    for os_type, browsers in BROWSER_PATHS.items()
+    for browser, paths in browsers.items()
+}
+
+
+def get_browser_paths(
+    os_type: OperatingSystem, browser: BrowserType
+) -> Tuple[str, ...]:
+    """Get candidate binary paths for an (OS, browser) pair.
+
+    Args:
+        os_type: Operating system type
+        browser: Browser type
+
+    Returns:
+        Tuple of candidate installation paths (empty if none known)
+    """
+    return _BROWSER_PATHS_FLAT.get((os_type, browser), ())
+
+
 # ================================================================
 # WebDriver Download URLs
 # ================================================================
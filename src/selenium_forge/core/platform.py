@@ -4,17 +4,49 @@ from __future__ import annotations
 
 import os
 import platform
+import re
+import shutil
 import subprocess
 import sys
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-
-import platformdirs
+from typing import Any, Dict, Optional
 
 from selenium_forge.core.constants import Architecture, BrowserType, OperatingSystem
 from selenium_forge.core.types import SystemInfo
 from selenium_forge.exceptions import InternalError, UserError
 
+# Version number extracted from browser --version output; compiled once
+# since get_browser_version sits on the driver startup path
+_VERSION_RE = re.compile(r"(\d+\.\d+\.\d+(?:\.\d+)?)")
+
+# Suggestion strings for the unsupported-platform errors, hoisted so the
+# raise sites allocate nothing beyond the exception itself
+_UNSUPPORTED_OS_SUGGESTION = "Selenium Forge supports Windows, macOS, and Linux"
+_UNSUPPORTED_ARCH_SUGGESTION = (
+    "Selenium Forge supports x64, x86, ARM64, and ARM architectures"
+)
+
+# Version flags in fallback order, and the flag each known binary
+# actually accepts (tried first to avoid wasted fork+exec probes)
+_VERSION_FLAGS = ("--version", "-version", "version")
+_PREFERRED_VERSION_FLAG = {
+    "google-chrome": "--version",
+    "google-chrome-stable": "--version",
+    "chrome": "--version",
+    "chrome.exe": "--version",
+    "chromium": "--version",
+    "chromium-browser": "--version",
+    "firefox": "--version",
+    "firefox.exe": "--version",
+    "firefox-esr": "--version",
+    "microsoft-edge": "--version",
+    "microsoft-edge-stable": "--version",
+    "msedge.exe": "--version",
+    "safari": "-version",
+}
+
 
 class PlatformDetector:
     """Detects platform information and system capabilities."""
@@ -23,102 +55,51 @@ class PlatformDetector:
     def detect_os() -> OperatingSystem:
         """Detect the operating system.
 
+        The result is memoized; see invalidate_cache.
+
         Returns:
             Operating system type
 
         Raises:
             UserError: If OS is not supported
         """
-        system = platform.system().lower()
-
-        if system == "windows":
-            return OperatingSystem.WINDOWS
-        elif system == "darwin":
-            return OperatingSystem.MACOS
-        elif system == "linux":
-            # Check if running under WSL
-            if PlatformDetector.is_wsl():
-                return OperatingSystem.WSL
-            return OperatingSystem.LINUX
-        else:
-            raise UserError(
-                f"Unsupported operating system: {system}",
-                suggestion="Selenium Forge supports Windows, macOS, and Linux",
-            )
+        return _detect_os()
 
     @staticmethod
     def is_wsl() -> bool:
         """Check if running under Windows Subsystem for Linux.
 
+        The result is memoized; see invalidate_cache.
+
         Returns:
             True if running under WSL, False otherwise
         """
-        try:
-            # Check for WSL in /proc/version
-            if Path("/proc/version").exists():
-                with open("/proc/version", "r") as f:
-                    version_info = f.read().lower()
-                    return "microsoft" in version_info or "wsl" in version_info
-
-            # Check for WSL environment variable
-            if "WSL_DISTRO_NAME" in os.environ:
-                return True
-
-        except Exception:
-            pass
-
-        return False
+        return _is_wsl()
 
     @staticmethod
     def detect_architecture() -> Architecture:
         """Detect system architecture.
 
+        The result is memoized; see invalidate_cache.
+
         Returns:
             System architecture type
 
         Raises:
             UserError: If architecture is not supported
         """
-        machine = platform.machine().lower()
-
-        if machine in ("amd64", "x86_64", "x64"):
-            return Architecture.X64
-        elif machine in ("i386", "i686", "x86"):
-            return Architecture.X86
-        elif machine in ("arm64", "aarch64"):
-            return Architecture.ARM64
-        elif machine.startswith("arm"):
-            return Architecture.ARM
-        else:
-            raise UserError(
-                f"Unsupported architecture: {machine}",
-                suggestion="Selenium Forge supports x64, x86, ARM64, and ARM architectures",
-            )
+        return _detect_architecture()
 
     @staticmethod
     def has_display() -> bool:
         """Check if system has a display server.
 
+        The result is memoized; see invalidate_cache.
+
         Returns:
             True if display is available, False otherwise
         """
-        # Windows always has display
-        if platform.system() == "Windows":
-            return True
-
-        # macOS always has display
-        if platform.system() == "Darwin":
-            return True
-
-        # Linux: check for DISPLAY environment variable
-        if "DISPLAY" in os.environ:
-            return True
-
-        # Check for Wayland
-        if "WAYLAND_DISPLAY" in os.environ:
-            return True
-
-        return False
+        return _has_display()
 
     @staticmethod
     def get_python_version() -> str:
@@ -133,41 +114,70 @@ class PlatformDetector:
     def get_selenium_version() -> str:
         """Get installed Selenium version.
 
+        The result is memoized; see invalidate_cache.
+
         Returns:
             Selenium version string
         """
-        try:
-            import selenium
+        return _get_selenium_version()
+
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Drop all memoized platform probes.
 
-            return selenium.__version__
-        except (ImportError, AttributeError):
-            return "unknown"
+        Platform facts are invariant within a process, so this only
+        matters for tests and for long-running processes that change the
+        environment (e.g. attaching a display) mid-run.
+        """
+        global _last_connectivity
+
+        _detect_os.cache_clear()
+        _is_wsl.cache_clear()
+        _detect_architecture.cache_clear()
+        _has_display.cache_clear()
+        _get_selenium_version.cache_clear()
+        _cached_system_info.cache_clear()
+        _detect_cache.cache_clear()
+        _last_connectivity = None
+        _free_port_pool.clear()
 
     @staticmethod
     def get_system_info() -> SystemInfo:
         """Get comprehensive system information.
 
+        The result is memoized: system details are invariant within a
+        process, and the probes behind them (reading /proc/version,
+        importing selenium for its version) are not free.
+
         Returns:
             SystemInfo object with all system details
         """
-        return SystemInfo(
-            os=str(PlatformDetector.detect_os()),
-            os_version=platform.version(),
-            architecture=str(PlatformDetector.detect_architecture()),
-            python_version=PlatformDetector.get_python_version(),
-            selenium_version=PlatformDetector.get_selenium_version(),
-            is_wsl=PlatformDetector.is_wsl(),
-            has_display=PlatformDetector.has_display(),
-        )
+        return _cached_system_info()
 
     @staticmethod
     def get_cache_dir() -> Path:
         """Get the cache directory for selenium-forge.
 
+        The directory is not created; callers about to write should use
+        ensure_cache_dir instead.
+
+        Returns:
+            Path to cache directory
+        """
+        # Imported lazily: most commands never touch the platform dirs,
+        # and the import can fail outright on embedded targets
+        import platformdirs
+
+        return Path(platformdirs.user_cache_dir("selenium-forge", "selenium-forge"))
+
+    @staticmethod
+    def ensure_cache_dir() -> Path:
+        """Get the cache directory, creating it if necessary.
+
         Returns:
             Path to cache directory
         """
-        cache_dir = Path(platformdirs.user_cache_dir("selenium-forge", "selenium-forge"))
+        cache_dir = PlatformDetector.get_cache_dir()
         cache_dir.mkdir(parents=True, exist_ok=True)
         return cache_dir
 
@@ -175,12 +185,24 @@ class PlatformDetector:
     def get_config_dir() -> Path:
         """Get the configuration directory for selenium-forge.
 
+        The directory is not created; callers about to write should use
+        ensure_config_dir instead.
+
         Returns:
             Path to config directory
         """
-        config_dir = Path(
-            platformdirs.user_config_dir("selenium-forge", "selenium-forge")
-        )
+        import platformdirs
+
+        return Path(platformdirs.user_config_dir("selenium-forge", "selenium-forge"))
+
+    @staticmethod
+    def ensure_config_dir() -> Path:
+        """Get the configuration directory, creating it if necessary.
+
+        Returns:
+            Path to config directory
+        """
+        config_dir = PlatformDetector.get_config_dir()
         config_dir.mkdir(parents=True, exist_ok=True)
         return config_dir
 
@@ -188,10 +210,24 @@ class PlatformDetector:
     def get_data_dir() -> Path:
         """Get the data directory for selenium-forge.
 
+        The directory is not created; callers about to write should use
+        ensure_data_dir instead.
+
+        Returns:
+            Path to data directory
+        """
+        import platformdirs
+
+        return Path(platformdirs.user_data_dir("selenium-forge", "selenium-forge"))
+
+    @staticmethod
+    def ensure_data_dir() -> Path:
+        """Get the data directory, creating it if necessary.
+
         Returns:
             Path to data directory
         """
-        data_dir = Path(platformdirs.user_data_dir("selenium-forge", "selenium-forge"))
+        data_dir = PlatformDetector.get_data_dir()
         data_dir.mkdir(parents=True, exist_ok=True)
         return data_dir
 
@@ -205,17 +241,46 @@ class PlatformDetector:
         Returns:
             Path to browser binary, or None if not found
         """
-        from selenium_forge.core.constants import BROWSER_PATHS
+        from selenium_forge.core.constants import get_browser_paths
+
+        # Served from the on-disk detection cache while the cached binary
+        # is unchanged; set SELENIUM_FORGE_REFRESH_DETECT=1 to bypass
+        cached = _detect_cache().get("binaries", {}).get(browser.value)
+        if cached is not None:
+            path = Path(cached["path"])
+            try:
+                if path.stat().st_mtime_ns == cached["mtime_ns"]:
+                    return path
+            except OSError:
+                pass  # Binary moved or was removed; re-detect
 
-        os_type = PlatformDetector.detect_os()
-        paths = BROWSER_PATHS.get(os_type, {}).get(browser, [])
+        paths = get_browser_paths(PlatformDetector.detect_os(), browser)
+
+        # One scandir per candidate directory (a single readdir batch)
+        # instead of a stat per candidate path — most candidates don't
+        # exist. Matching in-memory preserves the priority order; names
+        # are case-folded on Windows.
+        fold_case = platform.system() == "Windows"
+        dir_entries: Dict[Path, set] = {}
 
         for path_str in paths:
             # Expand environment variables
-            path_str = os.path.expandvars(path_str)
-            path = Path(path_str)
+            path = Path(os.path.expandvars(path_str))
+            parent = path.parent
 
-            if path.exists():
+            names = dir_entries.get(parent)
+            if names is None:
+                try:
+                    with os.scandir(parent) as entries:
+                        names = {entry.name for entry in entries}
+                except OSError:
+                    names = set()
+                if fold_case:
+                    names = {name.lower() for name in names}
+                dir_entries[parent] = names
+
+            if (path.name.lower() if fold_case else path.name) in names:
+                _detect_cache_store_binary(browser, path)
                 return path
 
         # Try to find in PATH
@@ -226,30 +291,15 @@ class PlatformDetector:
             BrowserType.SAFARI: ["safari"],
         }
 
+        # shutil.which does the same PATH walk as where/which in-process
+        # (os.access per candidate) without a fork+exec per name, and
+        # handles PATHEXT on Windows
         for binary_name in binary_names.get(browser, []):
-            try:
-                if os_type == OperatingSystem.WINDOWS:
-                    # Use where on Windows
-                    result = subprocess.run(
-                        ["where", binary_name],
-                        capture_output=True,
-                        text=True,
-                        check=False,
-                    )
-                else:
-                    # Use which on Unix-like systems
-                    result = subprocess.run(
-                        ["which", binary_name],
-                        capture_output=True,
-                        text=True,
-                        check=False,
-                    )
-
-                if result.returncode == 0 and result.stdout.strip():
-                    return Path(result.stdout.strip().split("\n")[0])
-
-            except Exception:
-                continue
+            resolved = shutil.which(binary_name)
+            if resolved:
+                path = Path(resolved)
+                _detect_cache_store_binary(browser, path)
+                return path
 
         return None
 
@@ -263,18 +313,38 @@ class PlatformDetector:
         Returns:
             Browser version string, or None if unable to determine
         """
-        if not browser_path.exists():
+        try:
+            mtime_ns = browser_path.stat().st_mtime_ns
+        except OSError:
             return None
 
+        # Versions are keyed on (path, mtime): a browser update rewrites
+        # the binary, so a matching entry is still accurate
+        version_key = f"{browser_path}:{mtime_ns}"
+        cached = _detect_cache().get("versions", {}).get(version_key)
+        if cached is not None:
+            return cached
+
+        # Browsers embed their version in installation metadata; reading
+        # it avoids forking the browser binary entirely
+        version = _version_from_metadata(browser_path)
+        if version:
+            _detect_cache_store("versions", version_key, version)
+            return version
+
         try:
-            # Try different version commands based on browser
-            commands = [
-                [str(browser_path), "--version"],
-                [str(browser_path), "-version"],
-                [str(browser_path), "version"],
-            ]
-
-            for cmd in commands:
+            # Try the flag this binary is known to accept first, so the
+            # usual case costs a single fork instead of burning one per
+            # rejected flag; remaining flags stay as fallback
+            preferred = _PREFERRED_VERSION_FLAG.get(
+                browser_path.name.lower(), "--version"
+            )
+            flags = (preferred,) + tuple(
+                flag for flag in _VERSION_FLAGS if flag != preferred
+            )
+
+            for flag in flags:
+                cmd = [str(browser_path), flag]
                 try:
                     result = subprocess.run(
                         cmd,
@@ -285,13 +355,11 @@ class PlatformDetector:
                     )
                     if result.returncode == 0 and result.stdout.strip():
                         # Extract version number
-                        import re
-
-                        version_match = re.search(
-                            r"(\d+\.\d+\.\d+(?:\.\d+)?)", result.stdout
-                        )
+                        version_match = _VERSION_RE.search(result.stdout)
                         if version_match:
-                            return version_match.group(1)
+                            version = version_match.group(1)
+                            _detect_cache_store("versions", version_key, version)
+                            return version
                 except (subprocess.TimeoutExpired, FileNotFoundError):
                     continue
 
@@ -304,32 +372,396 @@ class PlatformDetector:
     def check_internet_connection(timeout: float = 5.0) -> bool:
         """Check if internet connection is available.
 
+        Results are reused for a short window (2 seconds) so polling
+        callers don't pay a network round trip per call.
+
         Args:
             timeout: Connection timeout in seconds
 
         Returns:
             True if internet is available, False otherwise
         """
+        global _last_connectivity
+
+        now = time.monotonic()
+        if (
+            _last_connectivity is not None
+            and now - _last_connectivity[0] < _CONNECTIVITY_TTL
+        ):
+            return _last_connectivity[1]
+
         import socket
 
         try:
-            # Try to connect to Google DNS
-            socket.create_connection(("8.8.8.8", 53), timeout=timeout)
-            return True
-        except (socket.error, socket.timeout):
-            return False
+            # UDP "connect" to Google DNS: a routing-table lookup that
+            # fails fast without a route, versus the TCP probe's full
+            # handshake + teardown and kernel TIME_WAIT entry
+            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            try:
+                s.settimeout(timeout)
+                s.connect(("8.8.8.8", 53))
+            finally:
+                s.close()
+            connected = True
+        except OSError:
+            connected = False
+
+        _last_connectivity = (now, connected)
+        return connected
 
     @staticmethod
     def get_free_port() -> int:
         """Get a free port on the system.
 
+        Ports are reserved in batches: one refill binds a handful of
+        sockets at once, so pool warm-up paths asking for several ports
+        back-to-back amortize the socket create/bind/close syscalls.
+
         Returns:
             Free port number
         """
-        import socket
+        if not _free_port_pool:
+            _refill_port_pool()
+        return _free_port_pool.pop()
+
 
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+# ================================================================
+# Network probe caches
+# ================================================================
+
+# Connectivity result with its probe timestamp; refreshed after the TTL
+_CONNECTIVITY_TTL = 2.0
+_last_connectivity: Optional[tuple] = None
+
+# Pre-reserved free ports, served LIFO and refilled in batches
+_PORT_POOL_SIZE = 8
+_free_port_pool: list = []
+
+
+def _refill_port_pool() -> None:
+    """Reserve a batch of free ports in one pass.
+
+    All sockets are held open while binding so the kernel hands out
+    distinct ports, then closed together. A pooled port can in principle
+    be taken by another process before use — the same race the previous
+    bind-and-close implementation had per call.
+    """
+    import socket
+
+    sockets = []
+    try:
+        for _ in range(_PORT_POOL_SIZE):
+            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             s.bind(("", 0))
             s.listen(1)
-            port = s.getsockname()[1]
-        return port
+            sockets.append(s)
+        _free_port_pool.extend(s.getsockname()[1] for s in sockets)
+    finally:
+        for s in sockets:
+            s.close()
+
+
+# ================================================================
+# On-disk browser detection cache
+# ================================================================
+
+# Finding a browser binary forks where/which and reading its version
+# forks the browser itself — tens of milliseconds per browser, every
+# run. The results only change when a binary is (re)installed, so they
+# are persisted keyed by path mtime and served without any fork.
+
+_DETECT_CACHE_NAME = "browser_detect.json"
+_REFRESH_ENV = "SELENIUM_FORGE_REFRESH_DETECT"
+
+
+@lru_cache(maxsize=1)
+def _detect_cache() -> Dict[str, Any]:
+    """Load the persisted browser-detection cache (single-slot).
+
+    Returns an empty cache when the file is missing, unreadable, or the
+    ``SELENIUM_FORGE_REFRESH_DETECT=1`` escape hatch is set.
+    """
+    if os.environ.get(_REFRESH_ENV) == "1":
+        return {}
+
+    import json
+
+    try:
+        cache_file = PlatformDetector.get_cache_dir() / _DETECT_CACHE_NAME
+        with open(cache_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            return data
+    except (OSError, ValueError):
+        pass
+
+    return {}
+
+
+def _detect_cache_store(section: str, key: str, value: Any) -> None:
+    """Record a detection result and persist the cache atomically.
+
+    Failures to write are ignored: the cache is an optimization, never a
+    requirement.
+    """
+    cache = _detect_cache()
+    cache.setdefault(section, {})[key] = value
+
+    import json
+
+    try:
+        cache_file = PlatformDetector.ensure_cache_dir() / _DETECT_CACHE_NAME
+        tmp_file = cache_file.with_suffix(".json.tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+
+def _version_from_metadata(browser_path: Path) -> Optional[str]:
+    """Read a browser version from installation metadata, without forking.
+
+    Launching the binary with ``--version`` costs a fork+exec per probe;
+    every major browser also records its version next to the binary:
+
+    - macOS: ``Info.plist`` in the app bundle (``CFBundleShortVersionString``)
+    - Chrome/Edge on Linux: a sibling ``product_info.json``
+    - Firefox: a sibling ``application.ini`` (``[App] Version``)
+    - Windows: the PE ``VS_VERSION_INFO`` resource
+
+    Returns:
+        Version string, or None if no metadata source matched
+    """
+    try:
+        system = platform.system()
+
+        if system == "Darwin":
+            # .../Browser.app/Contents/MacOS/binary -> .../Contents/Info.plist
+            plist_path = browser_path.parent.parent / "Info.plist"
+            if plist_path.exists():
+                import plistlib
+
+                with open(plist_path, "rb") as f:
+                    version = plistlib.load(f).get("CFBundleShortVersionString")
+                if version:
+                    return str(version)
+
+        elif system == "Windows":
+            return _version_from_pe(browser_path)
+
+        else:
+            info_path = browser_path.parent / "product_info.json"
+            if info_path.exists():
+                import json
+
+                version = json.loads(info_path.read_text()).get("version")
+                if version:
+                    return str(version)
+
+            ini_path = browser_path.parent / "application.ini"
+            if ini_path.exists():
+                import configparser
+
+                parser = configparser.ConfigParser()
+                parser.read(ini_path)
+                version = parser.get("App", "Version", fallback=None)
+                if version:
+                    return version
+
+    except Exception:
+        pass
+
+    return None
+
+
+def _version_from_pe(browser_path: Path) -> Optional[str]:
+    """Read the version from a Windows PE VS_VERSION_INFO resource."""
+    try:
+        import ctypes
+
+        version_dll = ctypes.windll.version  # type: ignore[attr-defined]
+        path = str(browser_path)
+
+        size = version_dll.GetFileVersionInfoSizeW(path, None)
+        if not size:
+            return None
+
+        data = ctypes.create_string_buffer(size)
+        if not version_dll.GetFileVersionInfoW(path, 0, size, data):
+            return None
+
+        value = ctypes.c_void_p()
+        length = ctypes.c_uint()
+        if not version_dll.VerQueryValueW(
+            data, "\\", ctypes.byref(value), ctypes.byref(length)
+        ):
+            return None
+
+        # VS_FIXEDFILEINFO: dwFileVersionMS/LS at offsets 8 and 12
+        fixed = ctypes.cast(value, ctypes.POINTER(ctypes.c_uint32 * 13)).contents
+        ms, ls = fixed[2], fixed[3]
+        return f"{ms >> 16}.{ms & 0xFFFF}.{ls >> 16}.{ls & 0xFFFF}"
+
+    except Exception:
+        return None
+
+
+def _detect_cache_store_binary(browser: BrowserType, path: Path) -> None:
+    """Persist a found browser binary keyed by its current mtime."""
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return
+    _detect_cache_store(
+        "binaries", browser.value, {"path": str(path), "mtime_ns": mtime_ns}
+    )
+
+
+# ================================================================
+# Memoized platform probes
+# ================================================================
+
+# Platform facts do not change within a process, so each probe runs at
+# most once; PlatformDetector keeps the public API and delegates here.
+
+
+@lru_cache(maxsize=1)
+def _detect_os() -> OperatingSystem:
+    """Detect the operating system (cached)."""
+    system = platform.system().lower()
+
+    if system == "windows":
+        return OperatingSystem.WINDOWS
+    elif system == "darwin":
+        return OperatingSystem.MACOS
+    elif system == "linux":
+        # Check if running under WSL
+        if _is_wsl():
+            return OperatingSystem.WSL
+        return OperatingSystem.LINUX
+    else:
+        raise UserError(
+            f"Unsupported operating system: {system}",
+            suggestion=_UNSUPPORTED_OS_SUGGESTION,
+        )
+
+
+@lru_cache(maxsize=1)
+def _is_wsl() -> bool:
+    """Check for Windows Subsystem for Linux (cached)."""
+    # WSL exports this on every distro; a dict lookup beats any file I/O
+    if os.environ.get("WSL_DISTRO_NAME"):
+        return True
+
+    # Look for the WSL kernel tokens in /proc/version. Open directly
+    # (EAFP, no exists() stat), read bytes so nothing is decoded, and
+    # bound the read: the tokens sit in the first line.
+    try:
+        with open("/proc/version", "rb") as f:
+            data = f.read(512).lower()
+    except OSError:
+        return False
+
+    return b"microsoft" in data or b"wsl" in data
+
+
+# Machine-name to architecture table; one hashed lookup instead of a
+# linear chain of tuple-membership branches
+_ARCH_MAP = {
+    "amd64": Architecture.X64,
+    "x86_64": Architecture.X64,
+    "x64": Architecture.X64,
+    "i386": Architecture.X86,
+    "i686": Architecture.X86,
+    "x86": Architecture.X86,
+    "arm64": Architecture.ARM64,
+    "aarch64": Architecture.ARM64,
+}
+
+
+@lru_cache(maxsize=1)
+def _interpreter_bits() -> str:
+    """Get the interpreter word size ('32bit'/'64bit', cached).
+
+    platform.architecture can shell out to ``file`` on some platforms,
+    so the result is memoized.
+    """
+    return platform.architecture()[0]
+
+
+@lru_cache(maxsize=1)
+def _detect_architecture() -> Architecture:
+    """Detect system architecture (cached)."""
+    machine = platform.machine().lower()
+
+    arch = _ARCH_MAP.get(machine)
+    if arch is None:
+        if machine.startswith("arm"):
+            arch = Architecture.ARM
+        else:
+            raise UserError(
+                f"Unsupported architecture: {machine}",
+                suggestion=_UNSUPPORTED_ARCH_SUGGESTION,
+            )
+
+    # platform.machine() reports the kernel, not the interpreter: a
+    # 32-bit Python on a 64-bit kernel (WSL, containers) must get 32-bit
+    # drivers or they fail at exec time
+    if _interpreter_bits() == "32bit":
+        if arch is Architecture.X64:
+            return Architecture.X86
+        if arch is Architecture.ARM64:
+            return Architecture.ARM
+
+    return arch
+
+
+@lru_cache(maxsize=1)
+def _has_display() -> bool:
+    """Check for a display server (cached).
+
+    Because the result is memoized, a process that gains a display
+    mid-run (e.g. exports DISPLAY after startup) must call
+    PlatformDetector.invalidate_cache() to re-probe.
+    """
+    # Windows and macOS always have a display
+    system = platform.system()
+    if system == "Windows" or system == "Darwin":
+        return True
+
+    # Linux: X11 or Wayland session markers
+    env = os.environ
+    return "DISPLAY" in env or "WAYLAND_DISPLAY" in env
+
+
+@lru_cache(maxsize=1)
+def _get_selenium_version() -> str:
+    """Get the installed Selenium version (cached)."""
+    try:
+        import selenium
+
+        return selenium.__version__
+    except (ImportError, AttributeError):
+        return "unknown"
+
+
+# Interned enum-to-string tables: SystemInfo stores plain strings, and
+# interning the handful of possible values lets downstream comparisons
+# hit pointer equality instead of re-stringifying enums per call
+_OS_STR = {os_type: sys.intern(str(os_type)) for os_type in OperatingSystem}
+_ARCH_STR = {arch: sys.intern(str(arch)) for arch in Architecture}
+
+
+@lru_cache(maxsize=1)
+def _cached_system_info() -> SystemInfo:
+    """Build the process-wide SystemInfo snapshot (single-slot cache)."""
+    return SystemInfo(
+        os=_OS_STR[_detect_os()],
+        os_version=platform.version(),
+        architecture=_ARCH_STR[_detect_architecture()],
+        python_version=PlatformDetector.get_python_version(),
+        selenium_version=_get_selenium_version(),
+        is_wsl=_is_wsl(),
+        has_display=_has_display(),
+    )
@@ -2,14 +2,51 @@
 
 from __future__ import annotations
 
+import re
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 from selenium_forge.core.constants import BrowserType, ProxyType
 
-
-@dataclass
+# Slotted dataclasses skip the per-instance __dict__: attribute access
+# becomes a C-level descriptor load and each instance shrinks to a fixed
+# layout. dataclass(slots=True) needs Python 3.10; older interpreters
+# just fall back to regular dataclasses.
+if sys.version_info >= (3, 10):
+    _SLOTS = {"slots": True}
+else:
+    _SLOTS: Dict[str, bool] = {}
+
+# Selenium proxy-dict layout per proxy type: a dispatch lookup replaces
+# the if/elif chain in to_selenium_format
+_SELENIUM_PROXY_KEYS: Dict[ProxyType, tuple] = {
+    ProxyType.HTTP: ("httpProxy", "sslProxy"),
+    ProxyType.HTTPS: ("httpProxy", "sslProxy"),
+    ProxyType.SOCKS4: ("socksProxy",),
+    ProxyType.SOCKS5: ("socksProxy",),
+}
+_SOCKS_VERSIONS: Dict[ProxyType, int] = {
+    ProxyType.SOCKS4: 4,
+    ProxyType.SOCKS5: 5,
+}
+
+# Fast path for the narrow scheme://[user:pass@]host:port grammar that
+# proxy lists actually use; anything fancier falls back to urlparse
+_PROXY_URL_RE = re.compile(
+    r"^(?P<scheme>\w+)://(?:(?P<username>[^:@]+):(?P<password>[^@]+)@)?"
+    r"(?P<host>[^:@/\[\]]+):(?P<port>\d+)$"
+)
+_PROXY_TYPE_MAP: Dict[str, ProxyType] = {
+    "http": ProxyType.HTTP,
+    "https": ProxyType.HTTPS,
+    "socks4": ProxyType.SOCKS4,
+    "socks5": ProxyType.SOCKS5,
+}
+
+
+@dataclass(**_SLOTS)
 class ProxyConfig:
     """Proxy configuration."""
 
@@ -20,31 +57,72 @@ class ProxyConfig:
     password: Optional[str] = None
     no_proxy: Optional[List[str]] = None
 
+    # Lazily built Selenium-format dict, reused across driver creations
+    _selenium_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Lazily built requests-format proxies dict, reused across probes
+    _requests_cache: Optional[Dict[str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def to_selenium_format(self) -> Dict[str, Any]:
         """Convert to Selenium proxy format.
 
+        The formatted dict is built once and cached on the instance; a
+        shallow copy is returned because Selenium may mutate it.
+
         Returns:
             Dictionary in Selenium proxy format
         """
-        proxy_str = f"{self.host}:{self.port}"
-        if self.username and self.password:
-            proxy_str = f"{self.username}:{self.password}@{proxy_str}"
+        cached = self._selenium_cache
+        if cached is None:
+            proxy_str = f"{self.host}:{self.port}"
+            if self.username and self.password:
+                proxy_str = f"{self.username}:{self.password}@{proxy_str}"
+
+            proxy_dict: Dict[str, Any] = {
+                "proxyType": "manual",
+            }
 
-        proxy_dict = {
-            "proxyType": "manual",
-        }
+            for key in _SELENIUM_PROXY_KEYS.get(self.proxy_type, ()):
+                proxy_dict[key] = proxy_str
 
-        if self.proxy_type in (ProxyType.HTTP, ProxyType.HTTPS):
-            proxy_dict["httpProxy"] = proxy_str
-            proxy_dict["sslProxy"] = proxy_str
-        elif self.proxy_type in (ProxyType.SOCKS4, ProxyType.SOCKS5):
-            proxy_dict["socksProxy"] = proxy_str
-            proxy_dict["socksVersion"] = 5 if self.proxy_type == ProxyType.SOCKS5 else 4
+            socks_version = _SOCKS_VERSIONS.get(self.proxy_type)
+            if socks_version is not None:
+                proxy_dict["socksVersion"] = socks_version
 
-        if self.no_proxy:
-            proxy_dict["noProxy"] = ",".join(self.no_proxy)
+            if self.no_proxy:
+                proxy_dict["noProxy"] = ",".join(self.no_proxy)
 
-        return proxy_dict
+            cached = self._selenium_cache = proxy_dict
+
+        return dict(cached)
+
+    def to_requests_format(self) -> Dict[str, str]:
+        """Convert to the proxies dict format used by requests.
+
+        Built once and cached on the instance; rotating schedulers probe
+        the same proxy every few seconds, so repeat calls return the
+        prebuilt dict. Treat the result as read-only (requests does not
+        mutate it).
+
+        Returns:
+            Dictionary mapping "http"/"https" to the proxy URL
+        """
+        cached = self._requests_cache
+        if cached is None:
+            proxy_url = f"{self.proxy_type}://"
+            if self.username and self.password:
+                proxy_url += f"{self.username}:{self.password}@"
+            proxy_url += f"{self.host}:{self.port}"
+
+            cached = self._requests_cache = {
+                "http": proxy_url,
+                "https": proxy_url,
+            }
+
+        return cached
 
     @classmethod
     def from_url(cls, url: str) -> ProxyConfig:
@@ -59,31 +137,36 @@ class ProxyConfig:
         Raises:
             ValueError: If URL format is invalid
         """
+        match = _PROXY_URL_RE.match(url)
+        if match:
+            # Lowercase scheme and host like urlparse does, so both
+            # parsing paths produce identical configs
+            return cls(
+                host=match["host"].lower(),
+                port=int(match["port"]),
+                proxy_type=_PROXY_TYPE_MAP.get(
+                    match["scheme"].lower(), ProxyType.HTTP
+                ),
+                username=match["username"],
+                password=match["password"],
+            )
+
         from urllib.parse import urlparse
 
         parsed = urlparse(url)
         if not parsed.hostname or not parsed.port:
             raise ValueError(f"Invalid proxy URL: {url}")
 
-        proxy_type_map = {
-            "http": ProxyType.HTTP,
-            "https": ProxyType.HTTPS,
-            "socks4": ProxyType.SOCKS4,
-            "socks5": ProxyType.SOCKS5,
-        }
-
-        proxy_type = proxy_type_map.get(parsed.scheme, ProxyType.HTTP)
-
         return cls(
             host=parsed.hostname,
             port=parsed.port,
-            proxy_type=proxy_type,
+            proxy_type=_PROXY_TYPE_MAP.get(parsed.scheme, ProxyType.HTTP),
             username=parsed.username,
             password=parsed.password,
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class StealthConfig:
     """Stealth mode configuration."""
 
@@ -110,7 +193,7 @@ class StealthConfig:
     languages: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class BrowserOptions:
     """Browser-specific options."""
 
@@ -146,7 +229,7 @@ class BrowserOptions:
     preferences: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DriverConfig:
     """Complete driver configuration."""
 
@@ -176,7 +259,7 @@ class DriverConfig:
     reuse_session: bool = False
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SystemInfo:
     """System information."""
 
@@ -189,7 +272,7 @@ class SystemInfo:
     has_display: bool = True
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DriverInfo:
     """WebDriver information."""
 
@@ -200,7 +283,7 @@ class DriverInfo:
     last_updated: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SessionInfo:
     """Browser session information."""
 
@@ -212,7 +295,7 @@ class SessionInfo:
     capabilities: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ProxyRotationConfig:
     """Proxy rotation configuration."""
 
@@ -224,7 +307,7 @@ class ProxyRotationConfig:
     health_check_timeout: float = 5.0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PerformanceMetrics:
     """Performance metrics for a session."""
 
@@ -3,17 +3,13 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional
-
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.edge.options import Options as EdgeOptions
-from selenium.webdriver.edge.service import Service as EdgeService
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.remote.webdriver import WebDriver
-from selenium.webdriver.safari.options import Options as SafariOptions
+from typing import TYPE_CHECKING, Any, Callable, Optional, Type, TypeVar
+
+if TYPE_CHECKING:
+    from selenium.webdriver.chrome.options import Options as ChromeOptions
+    from selenium.webdriver.edge.options import Options as EdgeOptions
+    from selenium.webdriver.firefox.options import Options as FirefoxOptions
+    from selenium.webdriver.remote.webdriver import WebDriver
 
 from selenium_forge.core.constants import BrowserType
 from selenium_forge.core.platform import PlatformDetector
@@ -21,6 +17,72 @@ from selenium_forge.core.types import BrowserOptions, DriverConfig, ProxyConfig
 from selenium_forge.drivers.manager import DriverManager
 from selenium_forge.exceptions import UserError
 
+# Any selenium Options class; keeps _cached_options/_clone_options typed
+# without importing the browser-specific classes at module level
+_OptionsT = TypeVar("_OptionsT")
+
+
+def _freeze_key(value: Any) -> Any:
+    """Build a hashable form of a nested options value.
+
+    Raises:
+        TypeError: If the value contains something unhashable/unorderable
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze_key(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze_key(v) for v in value)
+    hash(value)
+    return value
+
+
+def _options_cache_key(browser_opts: BrowserOptions) -> Optional[tuple]:
+    """Derive a hashable cache key from BrowserOptions, or None.
+
+    None means the options contain values that cannot be frozen (custom
+    objects in preferences, say) and must be rebuilt per driver.
+    """
+    try:
+        key = (
+            browser_opts.headless,
+            _freeze_key(browser_opts.window_size),
+            browser_opts.start_maximized,
+            browser_opts.binary_location,
+            browser_opts.profile_directory,
+            tuple(browser_opts.extensions),
+            browser_opts.disable_images,
+            browser_opts.disable_javascript,
+            browser_opts.disable_css,
+            browser_opts.disable_plugins,
+            browser_opts.download_directory,
+            browser_opts.auto_download,
+            _freeze_key(browser_opts.experimental_options),
+            tuple(browser_opts.arguments),
+            _freeze_key(browser_opts.preferences),
+        )
+        # Guard the whole tuple: plain fields holding exotic unhashable
+        # values must also divert to the uncached build path
+        hash(key)
+        return key
+    except TypeError:
+        return None
+
+
+def _clone_options(template: _OptionsT) -> _OptionsT:
+    """Clone a built Options object so the template stays pristine.
+
+    Shallow-copies the instance and deep-copies its mutable containers
+    (argument lists, experimental-option and capability dicts), which
+    the proxy/capability steps mutate per driver.
+    """
+    import copy
+
+    clone = copy.copy(template)
+    for attr, value in vars(template).items():
+        if isinstance(value, (list, dict, set)):
+            setattr(clone, attr, copy.deepcopy(value))
+    return clone
+
 
 class DriverFactory:
     """Factory for creating WebDriver instances with full configuration."""
@@ -33,6 +95,11 @@ class DriverFactory:
         """
         self.driver_manager = driver_manager or DriverManager()
 
+        # Built Options objects keyed by (browser kind, frozen options):
+        # a pool creating N identical sessions assembles the options once
+        # and clones, instead of replaying every add_argument per driver
+        self._options_templates: dict = {}
+
     def create_driver(self, config: DriverConfig) -> WebDriver:
         """Create WebDriver instance from configuration.
 
@@ -69,10 +136,15 @@ class DriverFactory:
 
     def _create_chrome_driver(self, config: DriverConfig) -> WebDriver:
         """Create Chrome WebDriver."""
-        options = ChromeOptions()
-
-        # Apply browser options
-        self._apply_chrome_options(options, config.browser_options)
+        # Selenium submodules are imported per browser method so a
+        # Chrome-only session never loads the other browser bindings
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options as ChromeOptions
+        from selenium.webdriver.chrome.service import Service as ChromeService
+
+        options = self._cached_options(
+            "chrome", ChromeOptions, self._apply_chrome_options, config.browser_options
+        )
 
         # Apply proxy
         if config.proxy:
@@ -100,10 +172,16 @@ class DriverFactory:
 
     def _create_firefox_driver(self, config: DriverConfig) -> WebDriver:
         """Create Firefox WebDriver."""
-        options = FirefoxOptions()
-
-        # Apply browser options
-        self._apply_firefox_options(options, config.browser_options)
+        from selenium import webdriver
+        from selenium.webdriver.firefox.options import Options as FirefoxOptions
+        from selenium.webdriver.firefox.service import Service as FirefoxService
+
+        options = self._cached_options(
+            "firefox",
+            FirefoxOptions,
+            self._apply_firefox_options,
+            config.browser_options,
+        )
 
         # Apply proxy
         if config.proxy:
@@ -131,10 +209,13 @@ class DriverFactory:
 
     def _create_edge_driver(self, config: DriverConfig) -> WebDriver:
         """Create Edge WebDriver."""
-        options = EdgeOptions()
+        from selenium import webdriver
+        from selenium.webdriver.edge.options import Options as EdgeOptions
+        from selenium.webdriver.edge.service import Service as EdgeService
 
-        # Apply browser options
-        self._apply_edge_options(options, config.browser_options)
+        options = self._cached_options(
+            "edge", EdgeOptions, self._apply_edge_options, config.browser_options
+        )
 
         # Apply proxy
         if config.proxy:
@@ -162,6 +243,9 @@ class DriverFactory:
 
     def _create_safari_driver(self, config: DriverConfig) -> WebDriver:
         """Create Safari WebDriver."""
+        from selenium import webdriver
+        from selenium.webdriver.safari.options import Options as SafariOptions
+
         options = SafariOptions()
 
         # Safari has limited options support
@@ -177,6 +261,39 @@ class DriverFactory:
 
         return driver
 
+    def _cached_options(
+        self,
+        kind: str,
+        options_cls: Type[_OptionsT],
+        apply_fn: Callable[[_OptionsT, BrowserOptions], None],
+        browser_opts: BrowserOptions,
+    ) -> _OptionsT:
+        """Get a built Options object, cloning a cached template if possible.
+
+        Args:
+            kind: Browser key for the template cache
+            options_cls: Selenium Options class to instantiate
+            apply_fn: The _apply_*_options method for this browser
+            browser_opts: Browser options to apply
+
+        Returns:
+            A fresh Options object the caller may mutate
+        """
+        key = _options_cache_key(browser_opts)
+        if key is None:
+            # Unfreezable options; assemble from scratch
+            options = options_cls()
+            apply_fn(options, browser_opts)
+            return options
+
+        template = self._options_templates.get((kind, key))
+        if template is None:
+            template = options_cls()
+            apply_fn(template, browser_opts)
+            self._options_templates[(kind, key)] = template
+
+        return _clone_options(template)
+
     def _apply_chrome_options(
         self, options: ChromeOptions, browser_opts: BrowserOptions
     ) -> None:
@@ -205,23 +322,21 @@ class DriverFactory:
         for ext_path in browser_opts.extensions:
             options.add_extension(ext_path)
 
+        # Collect all pref changes locally and commit them in a single
+        # add_experimental_option call at the end
+        prefs = dict(options.experimental_options.get("prefs", {}))
+
         # Performance options
         if browser_opts.disable_images:
-            prefs = options.experimental_options.get("prefs", {})
             prefs["profile.managed_default_content_settings.images"] = 2
-            options.add_experimental_option("prefs", prefs)
 
         if browser_opts.disable_javascript:
-            prefs = options.experimental_options.get("prefs", {})
             prefs["profile.managed_default_content_settings.javascript"] = 2
-            options.add_experimental_option("prefs", prefs)
 
         # Download directory
         if browser_opts.download_directory:
-            prefs = options.experimental_options.get("prefs", {})
             prefs["download.default_directory"] = str(browser_opts.download_directory)
             prefs["download.prompt_for_download"] = not browser_opts.auto_download
-            options.add_experimental_option("prefs", prefs)
 
         # Custom arguments
         for arg in browser_opts.arguments:
@@ -229,9 +344,10 @@ class DriverFactory:
 
         # Preferences
         if browser_opts.preferences:
-            existing_prefs = options.experimental_options.get("prefs", {})
-            existing_prefs.update(browser_opts.preferences)
-            options.add_experimental_option("prefs", existing_prefs)
+            prefs.update(browser_opts.preferences)
+
+        if prefs:
+            options.add_experimental_option("prefs", prefs)
 
         # Experimental options
         for key, value in browser_opts.experimental_options.items():
@@ -2,21 +2,300 @@
 
 from __future__ import annotations
 
+import atexit
+import importlib
 import json
+import os
+import re
+import shutil
 import subprocess
-from datetime import datetime, timedelta
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+try:
+    # orjson serializes small dicts several times faster than the stdlib
+    import orjson
+
+    def _json_dumps(obj: Dict) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _json_loads = orjson.loads
+except ImportError:
+
+    def _json_dumps(obj: Dict) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+    _json_loads = json.loads
 
 from selenium_forge.core.constants import BrowserType, OperatingSystem, Architecture
 from selenium_forge.core.platform import PlatformDetector
 from selenium_forge.core.types import DriverInfo
-from selenium_forge.exceptions import RetryableError, UserError
+from selenium_forge.exceptions import RetryableError, UserError, wrap_exception
 from selenium_forge.utils.download import Downloader
 from selenium_forge.utils.filesystem import FileSystemManager
 
+# Upstream "latest release" endpoints, probed with conditional requests so
+# an unchanged release costs a single 304 round-trip
+_LATEST_VERSION_URLS: Dict[BrowserType, str] = {
+    BrowserType.CHROME: (
+        "https://googlechromelabs.github.io/chrome-for-testing/"
+        "last-known-good-versions.json"
+    ),
+    BrowserType.FIREFOX: (
+        "https://api.github.com/repos/mozilla/geckodriver/releases/latest"
+    ),
+    BrowserType.EDGE: "https://msedgedriver.azureedge.net/LATEST_STABLE",
+}
+
+# How long a remote-version probe result is reused in-process (seconds)
+_REMOTE_VERSION_TTL = 60.0
+
+# Release archives for direct (resumable) downloads, keyed by platform
+_CFT_DOWNLOADS_URL = (
+    "https://googlechromelabs.github.io/chrome-for-testing/"
+    "last-known-good-versions-with-downloads.json"
+)
+_CFT_PLATFORMS: Dict[Tuple[OperatingSystem, Architecture], str] = {
+    (OperatingSystem.LINUX, Architecture.X64): "linux64",
+    (OperatingSystem.WSL, Architecture.X64): "linux64",
+    (OperatingSystem.MACOS, Architecture.X64): "mac-x64",
+    (OperatingSystem.MACOS, Architecture.ARM64): "mac-arm64",
+    (OperatingSystem.WINDOWS, Architecture.X64): "win64",
+    (OperatingSystem.WINDOWS, Architecture.X86): "win32",
+}
+_GECKO_PLATFORMS: Dict[Tuple[OperatingSystem, Architecture], str] = {
+    (OperatingSystem.LINUX, Architecture.X64): "linux64",
+    (OperatingSystem.WSL, Architecture.X64): "linux64",
+    (OperatingSystem.LINUX, Architecture.ARM64): "linux-aarch64",
+    (OperatingSystem.MACOS, Architecture.X64): "macos",
+    (OperatingSystem.MACOS, Architecture.ARM64): "macos-aarch64",
+    (OperatingSystem.WINDOWS, Architecture.X64): "win64",
+    (OperatingSystem.WINDOWS, Architecture.X86): "win32",
+}
+
+# Fallback cache age cutoff when the remote probe is unavailable (7 days)
+_CACHE_MAX_AGE = 7 * 86400
+
+
+def _entry_timestamp(last_updated: object) -> Optional[float]:
+    """Read a metadata ``last_updated`` value as epoch seconds.
+
+    New metadata stores a ``time.time()`` float; entries written by older
+    versions hold an ISO-8601 string and are parsed for compatibility.
+    """
+    try:
+        return float(last_updated)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        pass
+    try:
+        return datetime.fromisoformat(str(last_updated)).timestamp()
+    except ValueError:
+        return None
+
+
+def _parse_latest_version(
+    browser: BrowserType, response: requests.Response
+) -> Optional[str]:
+    """Extract the latest release version from an endpoint response."""
+    try:
+        if browser == BrowserType.CHROME:
+            return response.json()["channels"]["Stable"]["version"]
+        if browser == BrowserType.FIREFOX:
+            return response.json().get("tag_name", "").lstrip("v") or None
+        # Edge serves a UTF-16-encoded plain-text version string
+        data = response.content
+        if data[:2] in (b"\xff\xfe", b"\xfe\xff"):
+            return data.decode("utf-16").strip() or None
+        return response.text.strip() or None
+    except Exception:
+        return None
+
+
+# webdriver-manager classes, imported lazily because the first import pulls
+# in a sizeable module tree that download-free sessions never need
+_WDM_IMPORTS: Dict[BrowserType, Tuple[str, str]] = {
+    BrowserType.CHROME: ("webdriver_manager.chrome", "ChromeDriverManager"),
+    BrowserType.FIREFOX: ("webdriver_manager.firefox", "GeckoDriverManager"),
+    BrowserType.EDGE: ("webdriver_manager.microsoft", "EdgeChromiumDriverManager"),
+}
+
+
+@lru_cache(maxsize=None)
+def _load_wdm(browser: BrowserType) -> type:
+    """Import and cache the webdriver-manager class for a browser.
+
+    Args:
+        browser: Browser type
+
+    Returns:
+        The webdriver-manager driver-manager class
+
+    Raises:
+        UserError: If webdriver-manager is not installed
+    """
+    module_name, class_name = _WDM_IMPORTS[browser]
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        raise UserError(
+            "webdriver-manager not installed",
+            suggestion="Install with: pip install webdriver-manager",
+        )
+    return getattr(module, class_name)
+
+
+# Version number in `driver --version` output, compiled once
+_VERSION_RE = re.compile(r"(\d+\.\d+\.\d+(?:\.\d+)?)")
+
+# Below this many files the executor costs more than it hides
+_CLEAN_THREAD_THRESHOLD = 32
+
+
+def _clean_directory_concurrent(directory: Path) -> int:
+    """Delete everything under a directory, fanning unlinks out to threads.
+
+    File deletion is dominated by filesystem latency (notably on Windows
+    and network storage), so large caches overlap the unlink syscalls via a
+    thread pool; small ones are cleaned inline to skip executor overhead.
+
+    Args:
+        directory: Directory to empty (the directory itself is kept)
+
+    Returns:
+        Number of files removed
+    """
+    files: List[str] = []
+    dirs: List[str] = []
+    stack = [str(directory)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.path)
+                        stack.append(entry.path)
+                    else:
+                        files.append(entry.path)
+        except OSError:
+            continue
+
+    def _unlink(path: str) -> bool:
+        try:
+            os.unlink(path)
+            return True
+        except OSError:
+            return False
+
+    if len(files) > _CLEAN_THREAD_THRESHOLD:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            removed = sum(executor.map(_unlink, files))
+    else:
+        removed = sum(map(_unlink, files))
+
+    # Children sort after their parent, so reverse order empties bottom-up
+    for path in sorted(dirs, reverse=True):
+        try:
+            os.rmdir(path)
+        except OSError:
+            pass
+
+    return removed
+
+
+# Connectivity result shared across managers; availability checks accept a
+# slightly stale answer rather than paying a socket probe per call
+_CONN_TTL = 30.0
+_conn_cache = {"ts": 0.0, "ok": False}
+
+
+def _check_connectivity(refresh: bool = False) -> bool:
+    """Check internet connectivity, reusing a recent result.
+
+    Args:
+        refresh: Force a fresh probe instead of the cached answer
+
+    Returns:
+        True if an internet connection appears available
+    """
+    now = time.monotonic()
+    if not refresh and now - _conn_cache["ts"] < _CONN_TTL:
+        return _conn_cache["ok"]
+
+    ok = PlatformDetector.check_internet_connection()
+    _conn_cache["ts"] = now
+    _conn_cache["ok"] = ok
+    return ok
+
+
+# Module-level caches: these probes return stable values for the life of
+# the process, and lru_cache on methods would pin the instance alive.
+
+
+@lru_cache(maxsize=1)
+def _resolve_safaridriver() -> Optional[str]:
+    """Locate safaridriver on PATH (cached for the process lifetime)."""
+    return shutil.which("safaridriver")
+
+
+@lru_cache(maxsize=1)
+def _detect_os_arch() -> Tuple[OperatingSystem, Architecture]:
+    """Detect the host OS and architecture once per process."""
+    return PlatformDetector.detect_os(), PlatformDetector.detect_architecture()
+
+
+@lru_cache(maxsize=32)
+def _probe_driver_version(driver_path: str, mtime_ns: int) -> str:
+    """Run ``driver --version`` and extract the version number.
+
+    Keyed by path and mtime so repeated metadata writes for the same
+    binary do not re-spawn the subprocess.
+    """
+    try:
+        result = subprocess.run(
+            [driver_path, "--version"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+            check=False,
+        )
+        if result.returncode == 0:
+            # Extract version number from output
+            version_match = _VERSION_RE.search(result.stdout)
+            if version_match:
+                return version_match.group(1)
+    except Exception:
+        pass
+
+    return "unknown"
+
+
+def _weak_flush(manager: "DriverManager") -> Callable[[], None]:
+    """Build an atexit callback that flushes the manager via a weak ref.
+
+    Holding only a weakref lets unreferenced managers be garbage
+    collected (running their close()); anything still alive at
+    interpreter exit gets its pending metadata written.
+    """
+    ref = weakref.ref(manager)
+
+    def _flush() -> None:
+        instance = ref()
+        if instance is not None:
+            instance.flush()
+
+    return _flush
+
 
 class DriverManager:
     """Manages WebDriver downloads, caching, and versioning."""
@@ -29,25 +308,73 @@ class DriverManager:
         """
         self.cache_dir = cache_dir or PlatformDetector.get_cache_dir() / "drivers"
         FileSystemManager.ensure_directory(self.cache_dir)
-        self.downloader = Downloader()
+        # One pooled session for version probes and downloads: keeps TCP/TLS
+        # connections to the release hosts alive across requests
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=8,
+                max_retries=Retry(
+                    total=3, backoff_factor=0.5, status_forcelist=(502, 503, 504)
+                ),
+            ),
+        )
+        self.downloader = Downloader(session=self._session)
         self.metadata_file = self.cache_dir / "metadata.json"
         self.metadata = self._load_metadata()
+        # Guards metadata mutation and writes when downloads run in parallel
+        self._metadata_lock = threading.Lock()
+        # Write-back cache: updates set a dirty flag and flush() coalesces
+        # them into one disk write; atexit covers anything still pending.
+        # Registered through a weak reference: a bound method would pin
+        # the manager (and its pooled session) alive until process exit.
+        self._dirty = False
+        self._atexit_flush = _weak_flush(self)
+        atexit.register(self._atexit_flush)
+        # Short-lived memo of remote-version probes: (monotonic ts, version)
+        self._remote_probe_cache: Dict[str, Tuple[float, Optional[str]]] = {}
+        # Download dispatch table: one dict lookup instead of an if/elif chain
+        self._downloaders = {
+            BrowserType.CHROME: self._download_chromedriver,
+            BrowserType.FIREFOX: self._download_geckodriver,
+            BrowserType.EDGE: self._download_edgedriver,
+        }
 
     def _load_metadata(self) -> Dict:
         """Load driver metadata from cache."""
-        if self.metadata_file.exists():
+        try:
+            return _json_loads(self.metadata_file.read_bytes())
+        except Exception:
+            return {}
+
+    def _save_metadata(self) -> None:
+        """Mark driver metadata as needing a write; flush() does the I/O."""
+        self._dirty = True
+
+    def flush(self) -> None:
+        """Write driver metadata to cache atomically if it has changed."""
+        with self._metadata_lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            tmp_file = self.metadata_file.with_suffix(".json.tmp")
             try:
-                with open(self.metadata_file, "r") as f:
-                    return json.load(f)
+                tmp_file.write_bytes(_json_dumps(self.metadata))
+                os.replace(tmp_file, self.metadata_file)
             except Exception:
                 pass
-        return {}
 
-    def _save_metadata(self) -> None:
-        """Save driver metadata to cache."""
+    def close(self) -> None:
+        """Flush pending metadata and close the shared HTTP session."""
+        atexit.unregister(self._atexit_flush)
+        self.flush()
+        self._session.close()
+
+    def __del__(self) -> None:
         try:
-            with open(self.metadata_file, "w") as f:
-                json.dump(self.metadata, f, indent=2)
+            self.close()
         except Exception:
             pass
 
@@ -72,13 +399,71 @@ class DriverManager:
         if browser == BrowserType.SAFARI:
             return self._get_safari_driver()
 
-        # Check cache first
-        cached_path = self._get_cached_driver(browser, version)
-        if cached_path and cached_path.exists():
-            return cached_path
+        try:
+            # Check cache first (existence is verified by the lookup itself)
+            cached_path = self._get_cached_driver(browser, version)
+            if cached_path:
+                return cached_path
 
-        # Download driver
-        return self._download_driver(browser, version)
+            # Download driver
+            return self._download_driver(browser, version)
+        finally:
+            self.flush()
+
+    def get_driver_paths(
+        self,
+        browsers: List[BrowserType],
+        versions: Optional[Dict[BrowserType, str]] = None,
+    ) -> Dict[BrowserType, Path]:
+        """Get paths to WebDrivers for several browsers, downloading in parallel.
+
+        Each download is I/O-bound (HTTP requests and subprocess calls), so
+        the per-browser work is fanned out across a thread pool. Metadata is
+        saved once at the end instead of after every download.
+
+        Args:
+            browsers: Browser types to provision
+            versions: Optional per-browser version overrides
+
+        Returns:
+            Mapping of browser type to WebDriver executable path
+
+        Raises:
+            UserError: If any driver cannot be obtained
+        """
+        if not browsers:
+            return {}
+
+        versions = versions or {}
+        paths: Dict[BrowserType, Path] = {}
+        errors: Dict[BrowserType, Exception] = {}
+
+        try:
+            with ThreadPoolExecutor(max_workers=min(len(browsers), 4)) as executor:
+                futures = {
+                    browser: executor.submit(
+                        self.get_driver_path, browser, versions.get(browser)
+                    )
+                    for browser in browsers
+                }
+                for browser, future in futures.items():
+                    try:
+                        paths[browser] = future.result()
+                    except Exception as e:
+                        errors[browser] = e
+        finally:
+            self.flush()
+
+        if errors:
+            failed = ", ".join(b.value for b in errors)
+            raise wrap_exception(
+                location="get_driver_paths",
+                original_exc=next(iter(errors.values())),
+                error_type=UserError,
+                browsers=failed,
+            )
+
+        return paths
 
     def _get_safari_driver(self) -> Path:
         """Get Safari WebDriver (safaridriver).
@@ -89,17 +474,9 @@ class DriverManager:
         Raises:
             UserError: If safaridriver is not available
         """
-        try:
-            result = subprocess.run(
-                ["which", "safaridriver"],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            if result.returncode == 0 and result.stdout.strip():
-                return Path(result.stdout.strip())
-        except Exception:
-            pass
+        driver = _resolve_safaridriver()
+        if driver:
+            return Path(driver)
 
         raise UserError(
             "Safari WebDriver (safaridriver) not found",
@@ -130,23 +507,94 @@ class DriverManager:
         if version and version != "latest":
             if driver_info.get("version") != version:
                 return None
-
-        # Check if cache is too old (more than 7 days)
-        last_updated = driver_info.get("last_updated")
-        if last_updated:
-            try:
-                last_update_date = datetime.fromisoformat(last_updated)
-                if datetime.now() - last_update_date > timedelta(days=7):
+        else:
+            # Event-driven invalidation: a cheap conditional probe of the
+            # upstream release endpoint replaces the blanket age cutoff, so
+            # an unchanged release never triggers a re-download
+            remote_version = self._remote_latest_version(browser)
+            if remote_version is not None:
+                if driver_info.get("version") != remote_version:
                     return None
-            except Exception:
-                pass
-
-        # Check if driver file exists
+            else:
+                # Probe unavailable (offline or unsupported browser): fall
+                # back to the age heuristic (more than 7 days)
+                last_updated = driver_info.get("last_updated")
+                if last_updated:
+                    ts = _entry_timestamp(last_updated)
+                    if ts is not None and time.time() - ts > _CACHE_MAX_AGE:
+                        return None
+
+        # Check if driver file exists (a single stat, no extra exists() probe)
         driver_path = Path(driver_info.get("path", ""))
-        if driver_path.exists():
-            return driver_path
+        try:
+            os.stat(driver_path)
+        except OSError:
+            return None
 
-        return None
+        return driver_path
+
+    def _remote_latest_version(self, browser: BrowserType) -> Optional[str]:
+        """Get the latest released driver version for a browser.
+
+        Issues a conditional request against the upstream release endpoint
+        using the ETag stored in metadata; an unchanged release answers with
+        a bodyless 304. Results are memoized in-process for a short TTL so a
+        session never probes the network more than once a minute per browser.
+
+        Args:
+            browser: Browser type
+
+        Returns:
+            Latest version string, or None if it cannot be determined
+        """
+        url = _LATEST_VERSION_URLS.get(browser)
+        if url is None:
+            return None
+
+        browser_key = browser.value
+        now = time.monotonic()
+        memo = self._remote_probe_cache.get(browser_key)
+        if memo is not None and now - memo[0] < _REMOTE_VERSION_TTL:
+            return memo[1]
+
+        entry = self.metadata.get(browser_key, {})
+        headers = {}
+        etag = entry.get("etag")
+        if etag:
+            headers["If-None-Match"] = etag
+
+        remote_version: Optional[str] = None
+        try:
+            response = self._session.get(url, headers=headers, timeout=5)
+            if response.status_code == 304:
+                remote_version = entry.get("remote_version")
+            elif response.ok:
+                remote_version = _parse_latest_version(browser, response)
+                if remote_version:
+                    self._store_remote_probe(
+                        browser_key,
+                        response.headers.get("ETag"),
+                        remote_version,
+                    )
+        except requests.RequestException:
+            # Offline or flaky network: callers fall back to the cached driver
+            pass
+
+        self._remote_probe_cache[browser_key] = (now, remote_version)
+        return remote_version
+
+    def _store_remote_probe(
+        self,
+        browser_key: str,
+        etag: Optional[str],
+        remote_version: str,
+    ) -> None:
+        """Persist the ETag and version from a remote release probe."""
+        with self._metadata_lock:
+            entry = self.metadata.setdefault(browser_key, {})
+            entry["etag"] = etag
+            entry["remote_version"] = remote_version
+            self._save_metadata()
 
     def _download_driver(
         self,
@@ -165,21 +613,123 @@ class DriverManager:
         Raises:
             UserError: If download fails
         """
-        os_type = PlatformDetector.detect_os()
-        arch = PlatformDetector.detect_architecture()
-
-        if browser == BrowserType.CHROME:
-            return self._download_chromedriver(version, os_type, arch)
-        elif browser == BrowserType.FIREFOX:
-            return self._download_geckodriver(version, os_type, arch)
-        elif browser == BrowserType.EDGE:
-            return self._download_edgedriver(version, os_type, arch)
-        else:
+        downloader = self._downloaders.get(browser)
+        if downloader is None:
             raise UserError(
                 f"Automatic driver download not supported for {browser}",
                 suggestion=f"Manually download {browser} driver and specify path",
             )
 
+        os_type, arch = _detect_os_arch()
+
+        # Try the direct (resumable) release download first; webdriver-manager
+        # remains the fallback when no direct URL can be resolved
+        driver_path = self._download_driver_direct(browser, version, os_type, arch)
+        if driver_path is not None:
+            return driver_path
+
+        return downloader(version, os_type, arch)
+
+    def _resolve_direct_url(
+        self,
+        browser: BrowserType,
+        version: Optional[str],
+        os_type: OperatingSystem,
+        arch: Architecture,
+    ) -> Optional[str]:
+        """Resolve a direct release-archive URL for a driver.
+
+        Args:
+            browser: Browser type
+            version: Requested version (None or 'latest' for latest)
+            os_type: Host operating system
+            arch: Host architecture
+
+        Returns:
+            Archive URL, or None if no direct URL is known
+        """
+        try:
+            if browser == BrowserType.CHROME:
+                platform_key = _CFT_PLATFORMS.get((os_type, arch))
+                if platform_key is None:
+                    return None
+                data = self._session.get(_CFT_DOWNLOADS_URL, timeout=10).json()
+                channel = data["channels"]["Stable"]
+                if version and version != "latest" and channel["version"] != version:
+                    return None
+                for item in channel["downloads"]["chromedriver"]:
+                    if item["platform"] == platform_key:
+                        return item["url"]
+
+            elif browser == BrowserType.FIREFOX:
+                platform_key = _GECKO_PLATFORMS.get((os_type, arch))
+                if platform_key is None:
+                    return None
+                data = self._session.get(
+                    _LATEST_VERSION_URLS[BrowserType.FIREFOX], timeout=10
+                ).json()
+                for asset in data.get("assets", ()):
+                    name = asset.get("name", "")
+                    if platform_key in name and not name.endswith(".asc"):
+                        return asset.get("browser_download_url")
+        except Exception:
+            return None
+
+        return None
+
+    def _download_driver_direct(
+        self,
+        browser: BrowserType,
+        version: Optional[str],
+        os_type: OperatingSystem,
+        arch: Architecture,
+    ) -> Optional[Path]:
+        """Download a driver straight from its release archive, resumably.
+
+        The archive streams into a ``.part`` file, so an interrupted
+        download picks up from the last byte on retry instead of refetching
+        the whole archive (webdriver-manager always restarts from zero).
+
+        Args:
+            browser: Browser type
+            version: Requested version (None or 'latest' for latest)
+            os_type: Host operating system
+            arch: Host architecture
+
+        Returns:
+            Path to the extracted driver, or None to fall back to
+            webdriver-manager
+        """
+        url = self._resolve_direct_url(browser, version, os_type, arch)
+        if url is None:
+            return None
+
+        archive = self.cache_dir / browser.value / url.rsplit("/", 1)[-1]
+        extract_dir = archive.parent / "extracted"
+        exe_name = "chromedriver" if browser == BrowserType.CHROME else "geckodriver"
+        if os_type == OperatingSystem.WINDOWS:
+            exe_name += ".exe"
+
+        try:
+            self.downloader.download_file(url, archive, resume=True)
+            self.downloader.extract_archive(archive, extract_dir)
+            archive.unlink()
+
+            for driver_path in sorted(extract_dir.rglob(exe_name)):
+                FileSystemManager.make_executable(driver_path)
+                self._update_metadata(
+                    browser,
+                    str(driver_path),
+                    self._get_driver_version(driver_path),
+                )
+                return driver_path
+        except (RetryableError, UserError):
+            # Partial .part files survive for the next attempt; let
+            # webdriver-manager have a go in the meantime
+            pass
+
+        return None
+
     def _download_chromedriver(
         self,
         version: Optional[str],
@@ -187,13 +737,10 @@ class DriverManager:
         arch: Architecture,
     ) -> Path:
         """Download ChromeDriver."""
+        # Use webdriver-manager for simplicity
+        manager_cls = _load_wdm(BrowserType.CHROME)
         try:
-            # Use webdriver-manager for simplicity
-            from webdriver_manager.chrome import ChromeDriverManager
-            from webdriver_manager.core.os_manager import ChromeType
-
-            manager = ChromeDriverManager()
-            driver_path = Path(manager.install())
+            driver_path = Path(manager_cls().install())
 
             # Update metadata
             self._update_metadata(
@@ -204,11 +751,6 @@ class DriverManager:
 
             return driver_path
 
-        except ImportError:
-            raise UserError(
-                "webdriver-manager not installed",
-                suggestion="Install with: pip install webdriver-manager",
-            )
         except Exception as e:
             raise UserError(
                 f"Failed to download ChromeDriver: {e}",
@@ -222,11 +764,9 @@ class DriverManager:
         arch: Architecture,
     ) -> Path:
         """Download GeckoDriver (Firefox)."""
+        manager_cls = _load_wdm(BrowserType.FIREFOX)
         try:
-            from webdriver_manager.firefox import GeckoDriverManager
-
-            manager = GeckoDriverManager()
-            driver_path = Path(manager.install())
+            driver_path = Path(manager_cls().install())
 
             self._update_metadata(
                 BrowserType.FIREFOX,
@@ -236,11 +776,6 @@ class DriverManager:
 
             return driver_path
 
-        except ImportError:
-            raise UserError(
-                "webdriver-manager not installed",
-                suggestion="Install with: pip install webdriver-manager",
-            )
         except Exception as e:
             raise UserError(
                 f"Failed to download GeckoDriver: {e}",
@@ -254,11 +789,9 @@ class DriverManager:
         arch: Architecture,
     ) -> Path:
         """Download EdgeDriver."""
+        manager_cls = _load_wdm(BrowserType.EDGE)
         try:
-            from webdriver_manager.microsoft import EdgeChromiumDriverManager
-
-            manager = EdgeChromiumDriverManager()
-            driver_path = Path(manager.install())
+            driver_path = Path(manager_cls().install())
 
             self._update_metadata(
                 BrowserType.EDGE,
@@ -268,11 +801,6 @@ class DriverManager:
 
             return driver_path
 
-        except ImportError:
-            raise UserError(
-                "webdriver-manager not installed",
-                suggestion="Install with: pip install webdriver-manager",
-            )
         except Exception as e:
             raise UserError(
                 f"Failed to download EdgeDriver: {e}",
@@ -289,24 +817,11 @@ class DriverManager:
             Version string
         """
         try:
-            result = subprocess.run(
-                [str(driver_path), "--version"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-                check=False,
-            )
-            if result.returncode == 0:
-                # Extract version number from output
-                import re
+            mtime_ns = driver_path.stat().st_mtime_ns
+        except OSError:
+            return "unknown"
 
-                version_match = re.search(r"(\d+\.\d+\.\d+(?:\.\d+)?)", result.stdout)
-                if version_match:
-                    return version_match.group(1)
-        except Exception:
-            pass
-
-        return "unknown"
+        return _probe_driver_version(str(driver_path), mtime_ns)
 
     def _update_metadata(
         self,
@@ -321,12 +836,13 @@ class DriverManager:
             driver_path: Path to driver
             version: Driver version
         """
-        self.metadata[browser.value] = {
-            "path": driver_path,
-            "version": version,
-            "last_updated": datetime.now().isoformat(),
-        }
-        self._save_metadata()
+        with self._metadata_lock:
+            # Update in place so probe fields (etag, remote_version) survive
+            entry = self.metadata.setdefault(browser.value, {})
+            entry["path"] = driver_path
+            entry["version"] = version
+            entry["last_updated"] = time.time()
+            self._save_metadata()
 
     def get_driver_info(self, browser: BrowserType) -> Optional[DriverInfo]:
         """Get information about cached driver.
@@ -342,11 +858,15 @@ class DriverManager:
             return None
 
         data = self.metadata[browser_key]
+        last_updated = data.get("last_updated")
+        if isinstance(last_updated, (int, float)):
+            # Metadata stores epoch seconds; DriverInfo keeps the ISO string
+            last_updated = datetime.fromtimestamp(last_updated).isoformat()
         return DriverInfo(
             browser=browser,
             driver_version=data.get("version", "unknown"),
             driver_path=Path(data.get("path", "")),
-            last_updated=data.get("last_updated"),
+            last_updated=last_updated,
         )
 
     def clear_cache(self, browser: Optional[BrowserType] = None) -> int:
@@ -356,32 +876,39 @@ class DriverManager:
             browser: Specific browser to clear (None for all)
 
         Returns:
-            Number of items cleared
+            Number of items cleared: metadata entries for a specific browser,
+            files actually deleted (including any orphans) for a full clear
         """
         if browser:
             # Clear specific browser
             browser_key = browser.value
             if browser_key in self.metadata:
                 driver_path = Path(self.metadata[browser_key].get("path", ""))
-                if driver_path.exists():
-                    FileSystemManager.delete_path(driver_path, ignore_errors=True)
+                FileSystemManager.delete_path(driver_path, ignore_errors=True)
                 del self.metadata[browser_key]
                 self._save_metadata()
+                self.flush()
                 return 1
             return 0
         else:
-            # Clear all
-            count = len(self.metadata)
-            FileSystemManager.clean_directory(self.cache_dir)
+            # Clear all; count what was actually unlinked so drivers on disk
+            # that never made it into metadata are not reported as zero
+            removed = _clean_directory_concurrent(self.cache_dir)
             self.metadata.clear()
             self._save_metadata()
-            return count
+            self.flush()
+            return removed
 
-    def is_driver_available(self, browser: BrowserType) -> bool:
+    def is_driver_available(self, browser: BrowserType, refresh: bool = False) -> bool:
         """Check if driver is available (cached or can be downloaded).
 
+        The connectivity probe result is cached for a short while, so
+        repeated availability queries stay cheap; pass ``refresh=True`` to
+        force a fresh probe.
+
         Args:
             browser: Browser type
+            refresh: Force a fresh connectivity probe
 
         Returns:
             True if available, False otherwise
@@ -395,8 +922,8 @@ class DriverManager:
 
         # Check if cached
         cached = self._get_cached_driver(browser, None)
-        if cached and cached.exists():
+        if cached:
             return True
 
         # Check if can be downloaded
-        return PlatformDetector.check_internet_connection()
+        return _check_connectivity(refresh=refresh)
@@ -20,6 +20,7 @@ from .base import (
 from .utils import (
     create_error_context,
     format_exception_chain,
+    lazy_chain,
     wrap_exception,
     get_exception_hierarchy,
     critical_error,
@@ -41,6 +42,7 @@ __all__ = [
     # Utility functions
     "create_error_context",
     "format_exception_chain",
+    "lazy_chain",
     "wrap_exception",
     "get_exception_hierarchy",
     
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+import time
 import traceback
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, TypeVar
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, TypeVar
 
 # ================================================================
 # Base Classes
@@ -12,6 +13,10 @@ from typing import Any, Dict, List, Optional, TypeVar
 
 T = TypeVar("T", bound="SeleniumForgeError")
 
+# Bumped whenever a new error subclass is defined, so cached introspection
+# (see utils.get_exception_hierarchy) can detect staleness with one lookup
+_HIERARCHY_STATE = {"version": 0}
+
 class SeleniumForgeError(Exception):
     """Base exception for all selenium-forge errors.
 
@@ -20,12 +25,44 @@ class SeleniumForgeError(Exception):
     and structured error reporting.
     """
 
+    # Slot descriptors keep attribute access fast and stop instances from
+    # populating a per-exception dict in tight retry loops
+    __slots__ = (
+        "_message",
+        "_msg_template",
+        "_msg_args",
+        "error_code",
+        "context",
+        "cause",
+        "_ts",
+        "_tb",
+    )
+
+    # Default error code, computed once per class (see __init_subclass__)
+    _DEFAULT_ERROR_CODE = "SF_SELENIUMFORGEERROR"
+
+    # Sentinel read by format_exception_chain: a plain attribute fetch is
+    # cheaper than an isinstance/MRO check per chain node
+    _is_sf_error: ClassVar[bool] = True
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Pay the f-string + upper() once per class definition; an explicit
+        # _DEFAULT_ERROR_CODE in the class body takes precedence
+        if "_DEFAULT_ERROR_CODE" not in cls.__dict__:
+            cls._DEFAULT_ERROR_CODE = f"SF_{cls.__name__.upper()}"
+        # Invalidate any cached hierarchy snapshots built from the old tree
+        _HIERARCHY_STATE["version"] += 1
+
     def __init__(
         self,
-        message: str,
+        message: Optional[str] = None,
         error_code: Optional[str] = None,
         context: Optional[Dict[str, Any]] = None,
         cause: Optional[Exception] = None,
+        *,
+        message_template: Optional[str] = None,
+        message_args: Tuple[Any, ...] = (),
     ) -> None:
         """
         Initialize the base exception.
@@ -35,20 +72,92 @@ class SeleniumForgeError(Exception):
             error_code: Unique error code for programmatic handling
             context: Additional context information for debugging
             cause: The underlying exception that caused this error
+            message_template: %-style template formatted lazily into the
+                message on first access (alternative to a precomputed message)
+            message_args: Arguments interpolated into message_template
             timestamp: The time when the error occurred
             traceback_str: Formatted traceback of the cause exception
         """
-        super().__init__(message)
-        self.message = message
-        self.error_code = error_code or self._get_default_error_code()
+        if message is not None:
+            super().__init__(message)
+        else:
+            super().__init__()
+        self._message = message
+        self._msg_template = message_template
+        self._msg_args = message_args
+        self.error_code = error_code or self._DEFAULT_ERROR_CODE
         self.context = context or {}
         self.cause = cause
-        self.timestamp = datetime.now(timezone.utc)
-        self.traceback_str = traceback.format_exc() if cause else None
+        # Epoch seconds are one C call; the timestamp property rebuilds the
+        # aware datetime only when something actually asks for it
+        self._ts = time.time()
+        # Traceback formatting is deferred; see the traceback_str property
+        self._tb: Optional[str] = None
 
     def _get_default_error_code(self) -> str:
         """Get the default error code for this exception type."""
-        return f"SF_{self.__class__.__name__.upper()}"
+        return self._DEFAULT_ERROR_CODE
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Collect slot state (plus any ad-hoc attributes) for copy/pickle."""
+        state: Dict[str, Any] = {}
+        for klass in type(self).__mro__:
+            for name in getattr(klass, "__slots__", ()):
+                try:
+                    state[name] = getattr(self, name)
+                except AttributeError:
+                    continue
+        instance_dict = getattr(self, "__dict__", None)
+        if instance_dict:
+            state.update(instance_dict)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the state captured by __getstate__."""
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Support copy and pickle with slotted state.
+
+        BaseException.__reduce__ only carries args and __dict__; with the
+        exception state living in __slots__ that would silently reset
+        error_code, context, cause and subclass fields on every copy.
+        """
+        return (self.__class__, self.args, self.__getstate__())
+
+    @property
+    def message(self) -> str:
+        """Human-readable error message.
+
+        When the exception was built from a template, interpolation (and any
+        expensive str() of the arguments) is deferred until someone actually
+        reads the message, then memoized.
+        """
+        if self._message is None and self._msg_template is not None:
+            self._message = self._msg_template % self._msg_args
+        return self._message or ""
+
+    @property
+    def timestamp(self) -> datetime:
+        """When the error occurred, as a timezone-aware datetime."""
+        return datetime.fromtimestamp(self._ts, tz=timezone.utc)
+
+    @property
+    def traceback_str(self) -> Optional[str]:
+        """Formatted traceback of the cause exception.
+
+        Built lazily on first access: formatting walks and renders the whole
+        frame chain, which is wasted work for exceptions that are caught and
+        handled without ever being serialized or logged.
+        """
+        if self._tb is None and self.cause is not None:
+            self._tb = "".join(
+                traceback.format_exception(
+                    type(self.cause), self.cause, self.cause.__traceback__
+                )
+            )
+        return self._tb
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert exception to dictionary for structured logging/reporting.
@@ -134,11 +243,16 @@ class SeleniumForgeWarning(UserWarning):
         self.message = message
         self.warning_code = warning_code or self._get_default_warning_code()
         self.context = context or {}
-        self.timestamp = datetime.now(timezone.utc)
+        self._ts = time.time()
 
     def _get_default_warning_code(self) -> str:
         """Get the default warning code for this warning type."""
         return f"SF_WARNING_{self.__class__.__name__.upper()}"
+
+    @property
+    def timestamp(self) -> datetime:
+        """When the warning occurred, as a timezone-aware datetime."""
+        return datetime.fromtimestamp(self._ts, tz=timezone.utc)
     
     def __str__(self) -> str:
         """String representation of the warning."""
@@ -161,9 +275,10 @@ class CriticalError(SeleniumForgeError):
 
     Used for errors that indicate fundamental problems that cannot be recovered from.
     """
-    
-    def _get_default_error_code(self) -> str:
-        return "SF_CRITICAL_ERROR"
+
+    __slots__ = ()
+
+    _DEFAULT_ERROR_CODE = "SF_CRITICAL_ERROR"
 
 
 class RetryableError(SeleniumForgeError):
@@ -172,14 +287,21 @@ class RetryableError(SeleniumForgeError):
     Used for transient errors like network issues, temporary file locks, etc.
     """
 
+    __slots__ = ("max_retries", "retry_delay")
+
+    _DEFAULT_ERROR_CODE = "SF_RETRYABLE_ERROR"
+
     def __init__(
         self,
-        message: str,
+        message: Optional[str] = None,
         error_code: Optional[str] = None,
         context: Optional[Dict[str, Any]] = None,
         cause: Optional[Exception] = None,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        *,
+        message_template: Optional[str] = None,
+        message_args: Tuple[Any, ...] = (),
     ) -> None:
         """Initialize retryable error.
 
@@ -190,14 +312,20 @@ class RetryableError(SeleniumForgeError):
             cause: Underlying cause
             max_retries: Maximum number of retries suggested
             retry_delay: Suggested delay between retries (seconds)
+            message_template: Lazy %-style message template (see SeleniumForgeError)
+            message_args: Arguments for message_template
         """
-        super().__init__(message, error_code, context, cause)
+        super().__init__(
+            message,
+            error_code,
+            context,
+            cause,
+            message_template=message_template,
+            message_args=message_args,
+        )
         self.max_retries = max_retries
         self.retry_delay = retry_delay
 
-    def _get_default_error_code(self) -> str:
-        return "SF_RETRYABLE_ERROR"
-    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dict with retry information."""
         data = super().to_dict()
@@ -214,14 +342,21 @@ class UserError(SeleniumForgeError):
 
     Used for errors that are the user's responsibility to fix.
     """
-    
+
+    __slots__ = ("suggestion",)
+
+    _DEFAULT_ERROR_CODE = "SF_USER_ERROR"
+
     def __init__(
         self,
-        message: str,
+        message: Optional[str] = None,
         error_code: Optional[str] = None,
         context: Optional[Dict[str, Any]] = None,
         cause: Optional[Exception] = None,
         suggestion: Optional[str] = None,
+        *,
+        message_template: Optional[str] = None,
+        message_args: Tuple[Any, ...] = (),
     ) -> None:
         """Initialize user error.
 
@@ -231,14 +366,19 @@ class UserError(SeleniumForgeError):
             context: Context information
             cause: Underlying cause
             suggestion: Suggested fix for the user
+            message_template: Lazy %-style message template (see SeleniumForgeError)
+            message_args: Arguments for message_template
         """
-        super().__init__(message, error_code, context, cause)
+        super().__init__(
+            message,
+            error_code,
+            context,
+            cause,
+            message_template=message_template,
+            message_args=message_args,
+        )
         self.suggestion = suggestion
 
-    def _get_default_error_code(self) -> str:
-        """Get default error code for user errors."""
-        return "SF_USER_ERROR"
-    
     def __str__(self) -> str:
         """String representation with suggestions."""
         base_str = super().__str__()
@@ -262,8 +402,9 @@ class InternalError(SeleniumForgeError):
     Used for errors that should never happen and indicate bugs in the library itself.
     """
 
-    def _get_default_error_code(self) -> str:
-        return "SF_INTERNAL_ERROR"
+    __slots__ = ()
+
+    _DEFAULT_ERROR_CODE = "SF_INTERNAL_ERROR"
 
  
 # ================================================================
@@ -277,15 +418,22 @@ class DeprecationError(SeleniumForgeError):
     Used when deprecated features are used and strict mode is enabled.
     """
 
+    __slots__ = ("deprecated_in", "removed_in", "alternative")
+
+    _DEFAULT_ERROR_CODE = "SF_DEPRECATION_ERROR"
+
     def __init__(
         self,
-        message: str,
+        message: Optional[str] = None,
         error_code: Optional[str] = None,
         context: Optional[Dict[str, Any]] = None,
         cause: Optional[Exception] = None,
         deprecated_in: Optional[str] = None,
         removed_in: Optional[str] = None,
         alternative: Optional[str] = None,
+        *,
+        message_template: Optional[str] = None,
+        message_args: Tuple[Any, ...] = (),
     ) -> None:
         """Initialize deprecation error.
 
@@ -297,15 +445,21 @@ class DeprecationError(SeleniumForgeError):
             deprecated_in: Version when feature was deprecated
             removed_in: Version when feature will be removed
             alternative: Suggested alternative
+            message_template: Lazy %-style message template (see SeleniumForgeError)
+            message_args: Arguments for message_template
         """
-        super().__init__(message, error_code, context, cause)
+        super().__init__(
+            message,
+            error_code,
+            context,
+            cause,
+            message_template=message_template,
+            message_args=message_args,
+        )
         self.deprecated_in = deprecated_in
         self.removed_in = removed_in
         self.alternative = alternative
 
-    def _get_default_error_code(self) -> str:
-        return "SF_DEPRECATION_ERROR"
-    
     def __str__(self) -> str:
         """String representation with deprecation info."""
         parts = [super().__str__()]
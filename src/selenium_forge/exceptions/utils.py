@@ -2,17 +2,62 @@
 
 from __future__ import annotations
 
-import inspect
-from typing import Any, Dict, List, Optional
+import copy
+from typing import Any, Callable, Dict, List, Optional
 from pathlib import Path
 
-from .base import SeleniumForgeError, CriticalError, UserError, RetryableError
+from .base import (
+    _HIERARCHY_STATE,
+    SeleniumForgeError,
+    CriticalError,
+    UserError,
+    RetryableError,
+)
 
 
 # ================================================================
 # Context and Data Processing Utilities
 # ================================================================
 
+# Values of these exact types pass through context conversion untouched
+_SIMPLE_TYPES = (str, int, float, bool, type(None))
+_SIMPLE_TYPE_SET = frozenset(_SIMPLE_TYPES)
+
+
+def _convert_item(item: Any) -> Any:
+    """Coerce a container element for logging (custom objects become strings)."""
+    if hasattr(item, "__dict__") and not isinstance(item, _SIMPLE_TYPES):
+        return str(item)
+    return item
+
+
+def _convert_seq(value: Any) -> List[Any]:
+    """Convert a list/tuple/set into a list of loggable elements."""
+    if type(value) is list and all(type(item) in _SIMPLE_TYPE_SET for item in value):
+        # Every element passes through unchanged: no rebuild needed
+        return value
+    return [_convert_item(item) for item in value]
+
+
+def _convert_dict(value: Dict[Any, Any]) -> Dict[Any, Any]:
+    """Convert a dict's values into loggable elements."""
+    if all(type(v) in _SIMPLE_TYPE_SET for v in value.values()):
+        return value
+    return {k: _convert_item(v) for k, v in value.items()}
+
+
+# Exact-type dispatch for the common context value types: a single dict hit
+# replaces the chain of isinstance/hasattr tests for the overwhelmingly
+# common cases (subclasses still go through the fallback branches below)
+_TRANSFORMS: Dict[type, Callable[[Any], Any]] = {
+    type(Path()): str,  # the platform-specific concrete Path class
+    list: _convert_seq,
+    tuple: _convert_seq,
+    set: _convert_seq,
+    frozenset: _convert_seq,
+    dict: _convert_dict,
+}
+
 
 def create_error_context(**kwargs: Any) -> Dict[str, Any]:
     """Create a standardized error context dictionary.
@@ -34,29 +79,27 @@ def create_error_context(**kwargs: Any) -> Dict[str, Any]:
     context: Dict[str, Any] = {}
 
     for key, value in kwargs.items():
-        # Handle Path objects by converting to string
-        if isinstance(value, Path):
-            context[key] = str(value)
-        # Handle complex custom objects by converting them to strings
-        elif hasattr(value, "__dict__") and not isinstance(value, (str, int, float, bool)):
-            context[key] = str(value)
-        # Handle lists, tuples, and sets by converting complex items inside to strings
-        elif isinstance(value, (list, tuple, set)):
-            context[key] = [
-                str(item) if hasattr(item, "__dict__") and not isinstance(item, (str, int, float, bool))
-                else item
-                for item in value
-            ]
-        # Handle dictionaries by converting complex values to strings
-        elif isinstance(value, dict):
-            context[key] = {
-                k: str(v) if hasattr(v, "__dict__") and not isinstance(v, (str, int, float, bool))
-                else v
-                for k, v in value.items()
-            }
-        # Handle simple types directly
-        else:
+        value_type = type(value)
+        # Fast paths: exact simple type or a registered transform
+        if value_type in _SIMPLE_TYPE_SET:
             context[key] = value
+        else:
+            transform = _TRANSFORMS.get(value_type)
+            if transform is not None:
+                context[key] = transform(value)
+            # Fallbacks for subclasses of the dispatched types
+            elif isinstance(value, Path):
+                context[key] = str(value)
+            elif isinstance(value, (list, tuple, set, frozenset)):
+                context[key] = [_convert_item(item) for item in value]
+            elif isinstance(value, dict):
+                context[key] = {k: _convert_item(v) for k, v in value.items()}
+            # Handle complex custom objects by converting them to strings
+            elif hasattr(value, "__dict__") and not isinstance(value, _SIMPLE_TYPES):
+                context[key] = str(value)
+            # Handle remaining simple values directly
+            else:
+                context[key] = value
 
     return context
 
@@ -66,7 +109,10 @@ def create_error_context(**kwargs: Any) -> Dict[str, Any]:
 # ================================================================
 
 
-def format_exception_chain(exc: Exception) -> str:
+def format_exception_chain(
+    exc: Exception,
+    _getattr: Callable[..., Any] = getattr,
+) -> str:
     """Format an exception chain for logging and debugging.
     
     This function traverses the complete chain of exceptions that led to an error,
@@ -112,28 +158,83 @@ def format_exception_chain(exc: Exception) -> str:
                 # [SF_ELEMENT_NOT_FOUND] Login button not found -> 
                 # NoSuchElementException: Unable to locate element: {"method":"id","selector":"missing-button"}
     """
-    parts: List[str] = []
-    current: Optional[Exception] = exc
+    # Fast path: most exceptions are unchained, so skip the list + join.
+    # The _is_sf_error sentinel replaces an isinstance/MRO check: every
+    # SeleniumForgeError class carries it, other exceptions do not.
+    if exc.__cause__ is None and exc.__context__ is None:
+        if _getattr(exc, "_is_sf_error", False):
+            return str(exc)
+        return f"{exc.__class__.__name__}: {exc}"
 
-    # Traverse the exception chain backwards from final exception to root cause
-    while current:
-        if isinstance(current, SeleniumForgeError):
+    parts: List[str] = []
+    current: Optional[BaseException] = exc
+    append = parts.append
+
+    # Traverse the exception chain backwards from final exception to root
+    # cause. Every BaseException carries __cause__/__context__ slots, so
+    # direct attribute access replaces the getattr-with-default ping-pong;
+    # the hoisted locals keep the hot loop on LOAD_FAST lookups.
+    while current is not None:
+        if _getattr(current, "_is_sf_error", False):
             # Use our custom __str__ method for formatting with error codes
-            parts.append(str(current))
+            append(str(current))
         else:
             # Format standard Python exceptions with class name and message
-            parts.append(f"{current.__class__.__name__}: {current}")
-        
-        # Move to the next exception in the chain
-        current = getattr(current, "__cause__", None) or getattr(current, "__context__", None)
+            append(f"{current.__class__.__name__}: {current}")
+
+        cause = current.__cause__
+        current = cause if cause is not None else current.__context__
 
     return " -> ".join(parts)
 
 
+class _LazyChain:
+    """Defers format_exception_chain until the wrapper is stringified.
+
+    Intended for logging calls: logging only stringifies arguments when
+    the record is actually emitted, so passing a _LazyChain means a
+    suppressed DEBUG message never pays for walking and formatting the
+    chain. The formatted string is memoized for handlers that render the
+    record more than once.
+    """
+
+    __slots__ = ("exc", "_s")
+
+    def __init__(self, exc: Exception) -> None:
+        self.exc = exc
+        self._s: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._s is None:
+            self._s = format_exception_chain(self.exc)
+        return self._s
+
+    def __repr__(self) -> str:
+        return f"lazy_chain({self.exc!r})"
+
+
+def lazy_chain(exc: Exception) -> _LazyChain:
+    """Wrap an exception for deferred chain formatting in log calls.
+
+    Args:
+        exc: The exception whose chain should be formatted on demand
+
+    Returns:
+        Object whose str() produces format_exception_chain(exc), computed
+        at most once
+
+    Example:
+        logger.debug("driver setup failed: %s", lazy_chain(e))
+        # The chain walk runs only if DEBUG logging is enabled
+    """
+    return _LazyChain(exc)
+
+
 def wrap_exception(
     location: str,
     original_exc: Exception,
     error_type: type[SeleniumForgeError] = SeleniumForgeError,
+    keep_traceback: bool = True,
     **context: Any,
 ) -> SeleniumForgeError:
     """Wrap a non-selenium-forge exception into a selenium-forge exception.
@@ -146,6 +247,10 @@ def wrap_exception(
         location: Where the error occurred (function name, method, operation)
         original_exc: The original exception that was caught
         error_type: Type of selenium-forge exception to create (defaults to base SeleniumForgeError)
+        keep_traceback: Whether to keep the original exception's traceback.
+            Pass False for errors that are stored or cached rather than
+            re-raised: each retained traceback pins its whole frame chain
+            (and every local in it) in memory for the wrapper's lifetime.
         **context: Additional context information for debugging (browser, url, retry_count, etc.)
         
     Returns:
@@ -178,16 +283,26 @@ def wrap_exception(
             # Output: [SF_DRIVER_INSTALLATION_ERROR] Error in download_chromedriver: Connection failed -> 
             #         ConnectionError: HTTPSConnectionPool(host='chromedriver.storage.googleapis.com', port=443)
     """
-    message = f"Error in {location}: {original_exc}"
-    
+    if not keep_traceback:
+        # Chain a shallow copy with its frames dropped so the caller's
+        # exception is untouched but the wrapper holds no frame objects
+        original_exc = copy.copy(original_exc)
+        original_exc.__traceback__ = None
+
     error_context = create_error_context(
         location=location,
         original_exception_type=original_exc.__class__.__name__,
         **context,
     )
 
-    # Create the wrapped exception
-    wrapped = error_type(message=message, context=error_context, cause=original_exc)
+    # Create the wrapped exception; the message template defers the
+    # (potentially expensive) str(original_exc) until the message is read
+    wrapped = error_type(
+        message_template="Error in %s: %s",
+        message_args=(location, original_exc),
+        context=error_context,
+        cause=original_exc,
+    )
     
     # Set up explicit exception chaining
     wrapped.__cause__ = original_exc
@@ -199,12 +314,17 @@ def wrap_exception(
 # Introspection and Documentation Utilities
 # ================================================================
 
+# Cached hierarchy snapshot paired with the subclass-registry version it was
+# built from; SeleniumForgeError.__init_subclass__ bumps the version whenever
+# a new exception class is defined, which invalidates this entry
+_hierarchy_cache: Optional[tuple[int, Dict[str, List[str]]]] = None
+
 
 def get_exception_hierarchy() -> Dict[str, List[str]]:
     """Get the exception hierarchy for documentation and debugging.
-    
-    This function uses Python's introspection capabilities to analyze all exception
-    classes defined in the current module and map out their inheritance relationships.
+
+    This function walks the subclass tree rooted at SeleniumForgeError and maps
+    out the inheritance relationships of every registered exception class.
     It's useful for generating documentation, understanding the exception structure,
     and debugging inheritance issues in the exception system.
     
@@ -229,21 +349,30 @@ def get_exception_hierarchy() -> Dict[str, List[str]]:
         # DriverError inherits from: BrowserError
         # ElementNotFoundError inherits from: BrowserError
     """
-    import inspect
-
-    hierarchy = {}
-
-    # Get the current module where SeleniumForgeError is defined
-    current_module = inspect.getmodule(SeleniumForgeError)
-    if current_module:
-        # Inspect all classes in this module
-        for name, obj in inspect.getmembers(current_module, inspect.isclass):
-            # Only include classes that inherit from Exception (but not Exception itself)
-            if issubclass(obj, Exception) and obj != Exception:
-                # Get the direct base classes that are also exceptions
-                bases = [base.__name__ for base in obj.__bases__ if issubclass(base, Exception)]
-                hierarchy[name] = bases
-    
+    global _hierarchy_cache
+
+    version = _HIERARCHY_STATE["version"]
+    if _hierarchy_cache is not None and _hierarchy_cache[0] == version:
+        return _hierarchy_cache[1]
+
+    hierarchy: Dict[str, List[str]] = {}
+
+    # Walk the subclass tree from the root; __subclasses__() is maintained by
+    # the interpreter, so this avoids scanning unrelated module members
+    stack = [SeleniumForgeError]
+    seen = set()
+    while stack:
+        cls = stack.pop()
+        if cls in seen:
+            continue
+        seen.add(cls)
+        # Record the direct base classes that are also exceptions
+        hierarchy[cls.__name__] = [
+            base.__name__ for base in cls.__bases__ if issubclass(base, Exception)
+        ]
+        stack.extend(cls.__subclasses__())
+
+    _hierarchy_cache = (version, hierarchy)
     return hierarchy
 
 
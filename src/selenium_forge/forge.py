@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from pathlib import Path
 from types import TracebackType
 from typing import Any, Dict, Optional, Type
@@ -25,6 +26,30 @@ from selenium_forge.exceptions import UserError
 from selenium_forge.session.manager import SessionManager
 from selenium_forge.stealth.engine import StealthEngine
 
+# Overrides that map straight onto BrowserOptions fields: for these,
+# create_driver can clone the prebuilt config instead of rebuilding it
+# from defaults (see _build_config)
+_LIGHTWEIGHT_OVERRIDES = frozenset({"headless", "window_size", "start_maximized"})
+
+# Keyword arguments forwarded verbatim into the config overrides; driving
+# the copy from these tables keeps _build_config to one dict lookup per key
+_BROWSER_OPT_KEYS = (
+    "window_size",
+    "start_maximized",
+    "binary_location",
+    "profile_directory",
+    "extensions",
+    "arguments",
+    "preferences",
+)
+_DRIVER_OPT_KEYS = (
+    "driver_version",
+    "implicit_wait",
+    "page_load_timeout",
+    "script_timeout",
+    "log_level",
+)
+
 
 class SeleniumForge:
     """Main API class for Selenium Forge.
@@ -52,6 +77,17 @@ class SeleniumForge:
             driver.get("https://example.com")
     """
 
+    # Fixed attribute layout: session-heavy orchestrators build many
+    # forges, and slots drop the per-instance __dict__ while making the
+    # attribute loads in create_driver fixed-offset
+    __slots__ = (
+        "browser",
+        "driver_manager",
+        "driver_factory",
+        "session_manager",
+        "config",
+    )
+
     def __init__(
         self,
         browser: str = "chrome",
@@ -111,7 +147,8 @@ class SeleniumForge:
         Returns:
             DriverConfig object
         """
-        # Start with defaults for browser
+        # Start with defaults for browser: the merged template is cached
+        # per browser inside DefaultConfigs, so this only pays a deepcopy
         config_dict = DefaultConfigs.get_browser_defaults(browser)
 
         # Load config file if provided
@@ -123,23 +160,11 @@ class SeleniumForge:
         overrides: Dict[str, Any] = {"browser": browser}
 
         # Browser options overrides
-        browser_options: Dict[str, Any] = {}
+        browser_options: Dict[str, Any] = {
+            key: kwargs[key] for key in _BROWSER_OPT_KEYS if key in kwargs
+        }
         if headless:
             browser_options["headless"] = True
-        if "window_size" in kwargs:
-            browser_options["window_size"] = kwargs["window_size"]
-        if "start_maximized" in kwargs:
-            browser_options["start_maximized"] = kwargs["start_maximized"]
-        if "binary_location" in kwargs:
-            browser_options["binary_location"] = kwargs["binary_location"]
-        if "profile_directory" in kwargs:
-            browser_options["profile_directory"] = kwargs["profile_directory"]
-        if "extensions" in kwargs:
-            browser_options["extensions"] = kwargs["extensions"]
-        if "arguments" in kwargs:
-            browser_options["arguments"] = kwargs["arguments"]
-        if "preferences" in kwargs:
-            browser_options["preferences"] = kwargs["preferences"]
 
         if browser_options:
             overrides["browser_options"] = browser_options
@@ -160,16 +185,9 @@ class SeleniumForge:
             }
 
         # Other overrides
-        if "driver_version" in kwargs:
-            overrides["driver_version"] = kwargs["driver_version"]
-        if "implicit_wait" in kwargs:
-            overrides["implicit_wait"] = kwargs["implicit_wait"]
-        if "page_load_timeout" in kwargs:
-            overrides["page_load_timeout"] = kwargs["page_load_timeout"]
-        if "script_timeout" in kwargs:
-            overrides["script_timeout"] = kwargs["script_timeout"]
-        if "log_level" in kwargs:
-            overrides["log_level"] = kwargs["log_level"]
+        overrides.update(
+            (key, kwargs[key]) for key in _DRIVER_OPT_KEYS if key in kwargs
+        )
 
         # Merge and validate
         config_dict = ConfigLoader.merge_configs(config_dict, overrides)
@@ -188,7 +206,36 @@ class SeleniumForge:
             driver = forge.create_driver(headless=True)
         """
         # Apply overrides if provided
-        if overrides:
+        if not overrides:
+            config = self.config
+        elif overrides.keys() <= _LIGHTWEIGHT_OVERRIDES:
+            # Fast path for the "same config, toggle a window option"
+            # pattern: patch a clone of the prebuilt config rather than
+            # re-merging defaults and re-validating from scratch
+            window_size = overrides.get("window_size")
+            if window_size is not None:
+                # Mirror ConfigSchema.validate_browser_options, which the
+                # full rebuild path runs: reject bad shapes here too and
+                # normalize list input to the tuple the factory expects
+                if (
+                    not isinstance(window_size, (list, tuple))
+                    or len(window_size) != 2
+                    or not all(isinstance(x, int) and x > 0 for x in window_size)
+                ):
+                    raise UserError(
+                        f"Invalid window_size: {window_size}",
+                        suggestion=(
+                            "window_size must be a list of two integers: "
+                            "[width, height]"
+                        ),
+                    )
+                overrides = {**overrides, "window_size": tuple(window_size)}
+
+            config = replace(
+                self.config,
+                browser_options=replace(self.config.browser_options, **overrides),
+            )
+        else:
             config = self._build_config(
                 browser=self.browser,
                 headless=overrides.get("headless", self.config.browser_options.headless),
@@ -197,8 +244,6 @@ class SeleniumForge:
                 config_file=None,
                 **overrides,
             )
-        else:
-            config = self.config
 
         # Create driver
         driver = self.driver_factory.create_driver(config)
@@ -335,6 +380,9 @@ class SeleniumForge:
     def get_system_info() -> SystemInfo:
         """Get system information.
 
+        Memoized inside PlatformDetector: the platform probes run once
+        per process and repeat calls return the cached SystemInfo.
+
         Returns:
             SystemInfo object
         """
@@ -2,19 +2,60 @@
 
 from __future__ import annotations
 
+import asyncio
+import warnings
+import requests
+from dataclasses import replace
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
+try:
+    # Optional "performance" extra: a single event loop keeps every probe
+    # socket in flight at once, where a thread pool caps concurrency at
+    # the worker count
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from selenium_forge.core.constants import ProxyType
 from selenium_forge.core.types import ProxyConfig
-from selenium_forge.exceptions import UserError
+from selenium_forge.exceptions import UserError, wrap_exception
 from selenium_forge.utils.network import NetworkUtils
 
 
+@lru_cache(maxsize=2048)
+def _parse_proxy_url(url: str) -> ProxyConfig:
+    """Parse a proxy URL, memoizing the result.
+
+    Rotation lists merged from several sources repeat entries; the cache
+    turns reparsing a duplicate URL into a dict lookup. Callers should
+    copy the returned config (dataclasses.replace) before handing it out,
+    since ProxyConfig instances are not frozen.
+    """
+    return ProxyConfig.from_url(url)
+
+
 class ProxyManager:
     """Manages proxy configurations and validation."""
 
+    __slots__ = ("_session",)
+
     def __init__(self) -> None:
         """Initialize proxy manager."""
-        self.network_utils = NetworkUtils()
+        # Shared session keeps TCP/TLS connections to the test host alive
+        # across probes instead of paying a handshake per requests.get
+        self._session = requests.Session()
+
+    def close(self) -> None:
+        """Close the shared probe session."""
+        self._session.close()
+
+    def __del__(self) -> None:
+        """Best-effort cleanup when the manager is garbage collected."""
+        try:
+            self.close()
+        except Exception:
+            pass
 
     def validate_proxy(
         self,
@@ -31,9 +72,10 @@ class ProxyManager:
             Tuple of (is_valid, error_message)
         """
         # Test basic connectivity
-        success, error = self.network_utils.test_proxy(
+        success, error = NetworkUtils.test_proxy(
             proxy,
             timeout=timeout,
+            session=self._session,
         )
 
         return (success, error)
@@ -53,22 +95,15 @@ class ProxyManager:
             Response time in seconds, or None if test fails
         """
         import time
-        import requests
 
         try:
-            proxy_url = f"{proxy.proxy_type}://"
-            if proxy.username and proxy.password:
-                proxy_url += f"{proxy.username}:{proxy.password}@"
-            proxy_url += f"{proxy.host}:{proxy.port}"
-
-            proxies = {
-                "http": proxy_url,
-                "https": proxy_url,
-            }
+            # Prebuilt and cached on the config, since schedulers reprobe
+            # the same proxy repeatedly
+            proxies = proxy.to_requests_format()
 
-            start_time = time.time()
-            response = requests.get(test_url, proxies=proxies, timeout=10)
-            end_time = time.time()
+            start_time = time.perf_counter()
+            response = self._session.get(test_url, proxies=proxies, timeout=10)
+            end_time = time.perf_counter()
 
             if response.status_code == 200:
                 return end_time - start_time
@@ -87,7 +122,7 @@ class ProxyManager:
         Returns:
             Public IP address, or None if unavailable
         """
-        return self.network_utils.get_public_ip(proxy)
+        return NetworkUtils.get_public_ip(proxy)
 
     def load_proxies_from_file(self, file_path: str) -> List[ProxyConfig]:
         """Load proxy list from file.
@@ -110,30 +145,92 @@ class ProxyManager:
         if not path.exists():
             raise UserError(f"Proxy file not found: {file_path}")
 
-        proxies: List[ProxyConfig] = []
-
         try:
-            with open(path, "r") as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    if not line or line.startswith("#"):
-                        continue
-
-                    try:
-                        proxy = ProxyConfig.from_url(line)
-                        proxies.append(proxy)
-                    except Exception as e:
-                        import warnings
-                        warnings.warn(f"Invalid proxy on line {line_num}: {line}")
-
+            # One buffered read, then a byte-level split: comments and
+            # blanks are filtered before any text decoding happens
+            lines = path.read_bytes().splitlines()
         except Exception as e:
-            raise UserError(
-                f"Failed to load proxy file: {e}",
-                cause=e,
+            # Proxy-load failures are frequently caught and stored by
+            # callers, so drop the traceback frames from the chain
+            raise wrap_exception(
+                location="load_proxies_from_file",
+                original_exc=e,
+                error_type=UserError,
+                keep_traceback=False,
+                file_path=str(path),
+            )
+
+        # Filter in one pass, then parse; bad lines are collected and
+        # reported as a single warning instead of one warn() per line
+        candidates = [
+            (line_num, stripped)
+            for line_num, stripped in enumerate((line.strip() for line in lines), 1)
+            if stripped and not stripped.startswith(b"#")
+        ]
+
+        proxies: List[ProxyConfig] = []
+        bad_lines: List[str] = []
+        for line_num, raw in candidates:
+            try:
+                # Decode only lines that survived filtering; the replace
+                # copies the cached parse so callers get their own
+                # mutable instance
+                proxies.append(replace(_parse_proxy_url(raw.decode())))
+            except Exception:
+                bad_lines.append(f"line {line_num}: {raw.decode(errors='replace')}")
+
+        if bad_lines:
+            warnings.warn(
+                f"Skipped {len(bad_lines)} invalid proxy entries in "
+                f"{file_path} ({'; '.join(bad_lines)})"
             )
 
         return proxies
 
+    async def _validate_proxy_async(
+        self,
+        proxy: ProxyConfig,
+        session: "aiohttp.ClientSession",
+        semaphore: asyncio.Semaphore,
+        test_url: str,
+        timeout: float,
+    ) -> Optional[ProxyConfig]:
+        """Probe one proxy through a shared aiohttp session."""
+        proxy_url = f"{proxy.proxy_type}://"
+        if proxy.username and proxy.password:
+            proxy_url += f"{proxy.username}:{proxy.password}@"
+        proxy_url += f"{proxy.host}:{proxy.port}"
+
+        try:
+            async with semaphore:
+                async with session.get(
+                    test_url,
+                    proxy=proxy_url,
+                    timeout=aiohttp.ClientTimeout(total=timeout),
+                ) as response:
+                    return proxy if response.status == 200 else None
+        except Exception:
+            return None
+
+    async def _filter_proxies_async(
+        self,
+        proxies: List[ProxyConfig],
+        timeout: float,
+        max_workers: int,
+    ) -> List[ProxyConfig]:
+        """Validate all proxies on one event loop, bounded by a semaphore."""
+        semaphore = asyncio.Semaphore(max_workers)
+        async with aiohttp.ClientSession() as session:
+            results = await asyncio.gather(
+                *[
+                    self._validate_proxy_async(
+                        proxy, session, semaphore, "https://httpbin.org/ip", timeout
+                    )
+                    for proxy in proxies
+                ]
+            )
+        return [proxy for proxy in results if proxy is not None]
+
     def filter_working_proxies(
         self,
         proxies: List[ProxyConfig],
@@ -142,6 +239,12 @@ class ProxyManager:
     ) -> List[ProxyConfig]:
         """Filter list to only working proxies.
 
+        With aiohttp installed (the "performance" extra), all proxies are
+        probed concurrently on one event loop instead of in waves of
+        max_workers blocking requests. SOCKS proxies (and installs without
+        aiohttp) fall back to the thread pool, since plain aiohttp only
+        tunnels through HTTP proxies.
+
         Args:
             proxies: List of proxy configurations
             timeout: Validation timeout per proxy
@@ -150,23 +253,35 @@ class ProxyManager:
         Returns:
             List of working proxies
         """
-        from concurrent.futures import ThreadPoolExecutor, as_completed
+        if aiohttp is not None and all(
+            proxy.proxy_type in (ProxyType.HTTP, ProxyType.HTTPS)
+            for proxy in proxies
+        ):
+            return asyncio.run(
+                self._filter_proxies_async(proxies, timeout, max_workers)
+            )
 
-        working_proxies: List[ProxyConfig] = []
+        from concurrent.futures import ThreadPoolExecutor, as_completed
 
         def test_proxy(proxy: ProxyConfig) -> Optional[ProxyConfig]:
             success, _ = self.validate_proxy(proxy, timeout)
             return proxy if success else None
 
+        # Preallocated slots written by index: no list growth in the
+        # completion loop, and the survivors keep their input order,
+        # which makes downstream rotation deterministic
+        slots: List[Optional[ProxyConfig]] = [None] * len(proxies)
+
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = [executor.submit(test_proxy, proxy) for proxy in proxies]
+            fut_to_idx = {
+                executor.submit(test_proxy, proxy): index
+                for index, proxy in enumerate(proxies)
+            }
 
-            for future in as_completed(futures):
+            for future in as_completed(fut_to_idx):
                 try:
-                    result = future.result()
-                    if result:
-                        working_proxies.append(result)
+                    slots[fut_to_idx[future]] = future.result()
                 except Exception:
                     continue
 
-        return working_proxies
+        return [proxy for proxy in slots if proxy is not None]
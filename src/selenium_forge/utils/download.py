@@ -23,16 +23,20 @@ class Downloader:
         self,
         timeout: float = DEFAULT_DOWNLOAD_TIMEOUT,
         chunk_size: int = 8192,
+        session: Optional[requests.Session] = None,
     ) -> None:
         """Initialize downloader.
 
         Args:
             timeout: Download timeout in seconds
             chunk_size: Download chunk size in bytes
+            session: Shared requests session to reuse connections with
+                other components (a private one is created if omitted)
         """
         self.timeout = timeout
         self.chunk_size = chunk_size
-        self.session = requests.Session()
+        self._owns_session = session is None
+        self.session = session or requests.Session()
         self.session.headers.update(
             {
                 "User-Agent": "selenium-forge/0.1.0 (+https://github.com/abdessamad-haddouche/selenium-forge)"
@@ -45,14 +49,20 @@ class Downloader:
         destination: Path,
         progress_callback: Optional[Callable[[int, int], None]] = None,
         verify_ssl: bool = True,
+        resume: bool = False,
     ) -> Path:
         """Download a file from URL to destination.
 
+        With ``resume=True`` the download streams into a ``.part`` file
+        that survives failures; a retry sends an HTTP Range request and
+        continues from the last byte instead of restarting.
+
         Args:
             url: URL to download from
             destination: Destination file path
             progress_callback: Optional callback for progress updates (downloaded, total)
             verify_ssl: Whether to verify SSL certificates
+            resume: Whether to resume a previous partial download
 
         Returns:
             Path to downloaded file
@@ -73,23 +83,35 @@ class Downloader:
             # Create parent directory
             destination.parent.mkdir(parents=True, exist_ok=True)
 
-            # Download to temporary file first
-            temp_file = destination.with_suffix(destination.suffix + ".tmp")
+            # Download to a partial file first
+            suffix = ".part" if resume else ".tmp"
+            temp_file = destination.with_suffix(destination.suffix + suffix)
 
             try:
+                headers = None
+                existing = 0
+                if resume and temp_file.exists():
+                    existing = temp_file.stat().st_size
+                    if existing:
+                        headers = {"Range": f"bytes={existing}-"}
+
                 response = self.session.get(
                     url,
                     stream=True,
                     timeout=self.timeout,
                     verify=verify_ssl,
+                    headers=headers,
                 )
+                if existing and response.status_code != 206:
+                    # Server ignored the Range request; start from scratch
+                    existing = 0
                 response.raise_for_status()
 
-                # Get total file size
-                total_size = int(response.headers.get("content-length", 0))
-                downloaded = 0
+                # Get total file size (content-length covers the remainder)
+                total_size = int(response.headers.get("content-length", 0)) + existing
+                downloaded = existing
 
-                with open(temp_file, "wb") as f:
+                with open(temp_file, "ab" if existing else "wb") as f:
                     for chunk in response.iter_content(chunk_size=self.chunk_size):
                         if chunk:
                             f.write(chunk)
@@ -122,8 +144,8 @@ class Downloader:
                     ).add_context("url", url)
 
             finally:
-                # Clean up temp file if it exists
-                if temp_file.exists():
+                # Clean up temp file unless a resumable partial should survive
+                if not resume and temp_file.exists():
                     temp_file.unlink()
 
         except Exception as e:
@@ -276,8 +298,9 @@ class Downloader:
             ).add_context("archive", str(archive_path))
 
     def close(self) -> None:
-        """Close the downloader session."""
-        self.session.close()
+        """Close the downloader session (borrowed sessions stay open)."""
+        if self._owns_session:
+            self.session.close()
 
     def __enter__(self) -> Downloader:
         """Context manager entry."""
@@ -59,6 +59,7 @@ class NetworkUtils:
         proxy_config: ProxyConfig,
         test_url: str = "https://httpbin.org/ip",
         timeout: float = 10.0,
+        session: Optional[requests.Session] = None,
     ) -> Tuple[bool, Optional[str]]:
         """Test if proxy is working.
 
@@ -66,6 +67,8 @@ class NetworkUtils:
             proxy_config: Proxy configuration
             test_url: URL to test with
             timeout: Request timeout in seconds
+            session: Optional shared session; reusing one keeps pooled
+                connections to the test host alive across probes
 
         Returns:
             Tuple of (success, error_message)
@@ -82,7 +85,8 @@ class NetworkUtils:
                 "https": proxy_url,
             }
 
-            response = requests.get(test_url, proxies=proxies, timeout=timeout)
+            requester = session if session is not None else requests
+            response = requester.get(test_url, proxies=proxies, timeout=timeout)
             if response.status_code == 200:
                 return (True, None)
             else:
@@ -0,0 +1,54 @@
+"""Staleness checks for the generated merged-config cache.
+
+``src/selenium_forge/config/_precomputed.py`` is written by
+``tools/build_defaults_cache.py`` and is only consulted when its
+``SOURCE_HASH`` matches the current ``config/defaults.py``. These tests
+fail loudly when the cache was not regenerated after an edit to the
+defaults, instead of letting ``_load_precomputed`` silently fall back to
+runtime merging forever.
+"""
+
+import copy
+
+from selenium_forge.config.defaults import (
+    _cached_browser_defaults,
+    _load_precomputed,
+)
+
+
+class TestPrecomputedCache:
+    """Test that the build-time config cache is present and current."""
+
+    def test_cache_is_fresh(self):
+        """The shipped cache must match defaults.py.
+
+        If this fails, rerun ``python tools/build_defaults_cache.py`` and
+        commit the regenerated ``_precomputed.py`` alongside your change.
+        """
+        assert _load_precomputed() is not None, (
+            "_precomputed.py is missing or stale; "
+            "rerun tools/build_defaults_cache.py"
+        )
+
+    def test_preset_entries_match_runtime_merge(self):
+        """Every cached preset must equal the merge it short-circuits."""
+        precomputed = _load_precomputed()
+        assert precomputed is not None
+
+        from selenium_forge.config.defaults import (
+            DefaultConfigs,
+            _merge_into,
+        )
+
+        preset_configs = {
+            "headless": DefaultConfigs.HEADLESS_CONFIG,
+            "stealth": DefaultConfigs.STEALTH_CONFIG,
+            "performance": DefaultConfigs.PERFORMANCE_CONFIG,
+            "testing": DefaultConfigs.TESTING_CONFIG,
+            "mobile": DefaultConfigs.MOBILE_CONFIG,
+        }
+
+        for (browser, preset), cached in precomputed.PRESETS.items():
+            expected = copy.deepcopy(_cached_browser_defaults(browser))
+            _merge_into(expected, preset_configs[preset])
+            assert cached == expected, f"stale cache entry for {(browser, preset)}"
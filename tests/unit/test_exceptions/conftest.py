@@ -5,18 +5,18 @@ from unittest.mock import Mock, patch
 from datetime import datetime, timezone
 
 @pytest.fixture
-def mock_datetime():
-    """Mock datetime for consistent testing."""
-    fixed_time = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-    with patch('selenium_forge.exceptions.base.datetime') as mock_dt:
-        mock_dt.now.return_value = fixed_time
-        yield mock_dt
+def mock_time():
+    """Mock time.time for consistent timestamps (2024-01-01T12:00:00Z)."""
+    fixed_epoch = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc).timestamp()
+    with patch('selenium_forge.exceptions.base.time') as mock_t:
+        mock_t.time.return_value = fixed_epoch
+        yield mock_t
 
 @pytest.fixture
 def mock_traceback():
     """Mock traceback for predictable output."""
     with patch('selenium_forge.exceptions.base.traceback') as mock_tb:
-        mock_tb.format_exc.return_value = "Mocked traceback"  # Remove the extra part
+        mock_tb.format_exception.return_value = ["Mocked traceback"]
         yield mock_tb
 
 @pytest.fixture
@@ -74,22 +74,27 @@ class TestSeleniumForgeError:
         error = SeleniumForgeError("Test", cause=original)
         assert error.cause is original
     
-    def test_timestamp_creation(self, mock_datetime):
-        """Test timestamp is set during initialization."""
+    def test_timestamp_creation(self, mock_time):
+        """Test timestamp is captured during initialization."""
         fixed_time = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-        mock_datetime.now.return_value = fixed_time
-        
+
         error = SeleniumForgeError("Test")
         assert error.timestamp == fixed_time
-        mock_datetime.now.assert_called_once_with(timezone.utc)
+        mock_time.time.assert_called_once_with()
     
     def test_traceback_with_cause(self, mock_traceback):
-        """Test traceback capture when cause is present."""
+        """Test traceback is formatted lazily when cause is present."""
         cause = ValueError("Original error")
         error = SeleniumForgeError("Test", cause=cause)
-        
-        mock_traceback.format_exc.assert_called_once()
+
+        # Formatting is deferred until traceback_str is actually read
+        mock_traceback.format_exception.assert_not_called()
         assert error.traceback_str == "Mocked traceback"
+        mock_traceback.format_exception.assert_called_once()
+
+        # Repeated access reuses the formatted string
+        assert error.traceback_str == "Mocked traceback"
+        mock_traceback.format_exception.assert_called_once()
     
     def test_traceback_without_cause(self):
         """Test no traceback when no cause."""
@@ -201,11 +206,8 @@ class TestSeleniumForgeError:
         
         assert result["cause"] == "Original error"
     
-    def test_to_dict_timestamp_format(self, mock_datetime):
+    def test_to_dict_timestamp_format(self, mock_time):
         """Test timestamp format in dictionary."""
-        fixed_time = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-        mock_datetime.now.return_value = fixed_time
-        
         error = SeleniumForgeError("Test")
         result = error.to_dict()
         
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+"""Generate the precomputed merged-config cache for DefaultConfigs.
+
+Enumerates every (browser, preset) combination plus the known scenarios,
+runs the runtime merge once, and writes the results as literals into
+``src/selenium_forge/config/_precomputed.py``. At runtime
+``DefaultConfigs.get_preset_config`` / ``get_scenario_config`` consult that
+module before falling back to merging, so steady state is a dict lookup.
+
+Run from the repository root after changing ``config/defaults.py``:
+
+    python tools/build_defaults_cache.py
+"""
+
+from __future__ import annotations
+
+import hashlib
+import pprint
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SRC_DIR = REPO_ROOT / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+BROWSERS = ("chrome", "firefox", "edge", "safari")
+PRESETS = ("headless", "stealth", "performance", "testing", "mobile")
+SCENARIOS = ("web-scraping", "testing", "bot", "data-collection")
+
+HEADER = '''"""Precomputed merged preset/scenario configurations.
+
+Generated by tools/build_defaults_cache.py -- do not edit by hand.
+``SOURCE_HASH`` is the SHA-256 of config/defaults.py at generation time;
+a mismatch at runtime means this cache is stale and is ignored.
+"""
+
+'''
+
+
+def main() -> None:
+    from selenium_forge.config.defaults import (
+        _cached_preset_config,
+        _cached_scenario_config,
+    )
+
+    defaults_path = SRC_DIR / "selenium_forge" / "config" / "defaults.py"
+    output_path = SRC_DIR / "selenium_forge" / "config" / "_precomputed.py"
+
+    # Remove any existing cache so the merges below run from source
+    if output_path.exists():
+        output_path.unlink()
+    _cached_preset_config.cache_clear()
+    _cached_scenario_config.cache_clear()
+
+    presets = {
+        (browser, preset): _cached_preset_config(preset, browser)
+        for browser in BROWSERS
+        for preset in PRESETS
+    }
+    scenarios = {
+        scenario: _cached_scenario_config(scenario) for scenario in SCENARIOS
+    }
+
+    source_hash = hashlib.sha256(defaults_path.read_bytes()).hexdigest()
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(HEADER)
+        f.write(f"SOURCE_HASH = {source_hash!r}\n\n")
+        f.write("PRESETS = ")
+        f.write(pprint.pformat(presets, indent=4, width=88, sort_dicts=True))
+        f.write("\n\n")
+        f.write("SCENARIOS = ")
+        f.write(pprint.pformat(scenarios, indent=4, width=88, sort_dicts=True))
+        f.write("\n")
+
+    print(f"Wrote {len(presets)} presets and {len(scenarios)} scenarios "
+          f"to {output_path.relative_to(REPO_ROOT)}")
+
+
+if __name__ == "__main__":
+    main()